@@ -16,53 +16,61 @@ Available Agents:
 Registry:
 - get_agent(name): Get agent instance by name
 - list_agents(): List all available agents
-"""
-
-# Export base agent
-from app.agents.base_agent import BaseAgent
 
-# Export agent registry functions
-from app.agents.registry import (
-    get_agent,
-    list_agents,
-    AGENT_REGISTRY
-)
+NOTE: Agent classes and registry helpers are resolved lazily (PEP 562) on first
+attribute access, so importing this package does not pull in httpx, analytics
+or model loader dependencies. Set AGENTS_EAGER_IMPORT=1 to resolve everything
+at import time (useful in CI to surface import errors early).
+"""
 
-# Export agent classes (with safe imports)
-try:
-    from app.agents.booking_agent import BookingAgent
-except ImportError:
-    BookingAgent = None
+import os
+import importlib
+from typing import Any, Dict
 
-try:
-    from app.agents.slot_agent import SlotAgent
-except ImportError:
-    SlotAgent = None
+# Export base agent (no heavy dependencies)
+from app.agents.base_agent import BaseAgent
 
-try:
-    from app.agents.carrier_score_agent import CarrierScoreAgent
-except ImportError:
-    CarrierScoreAgent = None
+# Lazily exported names -> defining module
+_LAZY: Dict[str, str] = {
+    # Agent registry functions
+    "get_agent": "app.agents.registry",
+    "list_agents": "app.agents.registry",
+    "AGENT_REGISTRY": "app.agents.registry",
+    
+    # Agent classes
+    "BookingAgent": "app.agents.booking_agent",
+    "SlotAgent": "app.agents.slot_agent",
+    "CarrierScoreAgent": "app.agents.carrier_score_agent",
+    "TrafficAgent": "app.agents.traffic_agent",
+    "AnomalyAgent": "app.agents.anomaly_agent",
+    "RecommendationAgent": "app.agents.recommendation_agent",
+    "BlockchainAuditAgent": "app.agents.blockchain_audit_agent",
+}
 
-try:
-    from app.agents.traffic_agent import TrafficAgent
-except ImportError:
-    TrafficAgent = None
 
-try:
-    from app.agents.anomaly_agent import AnomalyAgent
-except ImportError:
-    AnomalyAgent = None
+def __getattr__(name: str) -> Any:
+    """
+    Resolve a lazily exported name on first access and memoize it in globals.
+    
+    Agent classes that fail to import resolve to None (safe import semantics).
+    """
+    module_path = _LAZY.get(name)
+    if module_path is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    
+    try:
+        value = getattr(importlib.import_module(module_path), name)
+    except ImportError:
+        if module_path == "app.agents.registry":
+            raise
+        value = None
+    
+    globals()[name] = value
+    return value
 
-try:
-    from app.agents.recommendation_agent import RecommendationAgent
-except ImportError:
-    RecommendationAgent = None
 
-try:
-    from app.agents.blockchain_audit_agent import BlockchainAuditAgent
-except ImportError:
-    BlockchainAuditAgent = None
+def __dir__():
+    return list(__all__)
 
 
 __all__ = [
@@ -78,3 +86,8 @@ __all__ = [
     "RecommendationAgent",
     "BlockchainAuditAgent",
 ]
+
+
+if os.getenv("AGENTS_EAGER_IMPORT", "").lower() in ("1", "true", "yes"):
+    for _name in _LAZY:
+        __getattr__(_name)
@@ -10,13 +10,58 @@ All operations require ADMIN or OPERATOR role.
 Returns structured responses with analytics data and recommendations.
 """
 
+import re
 import logging
-from typing import Dict, Any
+import functools
+from collections import Counter
+from typing import Any, Optional
 
 from app.agents.base_agent import BaseAgent
 
 logger = logging.getLogger(__name__)
 
+# Roles allowed to use this agent
+_PRIVILEGED_ROLES = frozenset(("ADMIN", "OPERATOR"))
+
+# Scenario parsing patterns (compiled once at import)
+_PCT_RE = re.compile(r"(\d+)\s*%")
+_TERM_RE = re.compile(r"terminal\s+([A-Z])", re.IGNORECASE)
+_HOURS_RE = re.compile(r"(\d+)\s*hours?")
+_SLOT_RE = re.compile(r"(\d+)\s*slot")
+
+# Message formatting symbols
+_STRESS_EMOJI = {"low": "✓", "medium": "⚠", "high": "⚠️", "critical": "🚨"}
+_DEFAULT_EMOJI = "•"
+_TREND_ARROWS = {-1: "↓", 0: "→", 1: "↑"}  # keyed by sign of the delta
+
+# Data sources consulted by proactive alert generation (reported in proofs)
+_ALERTS_SOURCES = ("stress_index", "capacity_data", "traffic_forecast", "anomalies")
+
+
+# ============================================================================
+# Analytics Functions (resolved once, on first use)
+# ============================================================================
+
+@functools.cache
+def _stress_fn():
+    """Return compute_stress_index, importing app.analytics.stress_index once."""
+    from app.analytics.stress_index import compute_stress_index
+    return compute_stress_index
+
+
+@functools.cache
+def _alerts_fn():
+    """Return generate_alerts, importing app.analytics.proactive_alerts once."""
+    from app.analytics.proactive_alerts import generate_alerts
+    return generate_alerts
+
+
+@functools.cache
+def _simulate_fn():
+    """Return simulate_scenario, importing app.analytics.what_if_simulation once."""
+    from app.analytics.what_if_simulation import simulate_scenario
+    return simulate_scenario
+
 
 class AnalyticsAgent(BaseAgent):
     """
@@ -30,7 +75,23 @@ class AnalyticsAgent(BaseAgent):
     RBAC: Requires ADMIN or OPERATOR role.
     """
     
-    async def run(self, context: Dict[str, Any]) -> Dict[str, Any]:
+    __slots__ = ("_dispatch",)
+    
+    # Intent -> handler method name
+    _INTENT_DISPATCH = {
+        "analytics_stress_index": "_handle_stress_index",
+        "analytics_alerts": "_handle_alerts",
+        "analytics_what_if": "_handle_what_if",
+    }
+    
+    def __init__(self):
+        # Bind handlers once so dispatch is a single dict lookup per request
+        self._dispatch = {
+            intent: getattr(self, method_name)
+            for intent, method_name in self._INTENT_DISPATCH.items()
+        }
+    
+    async def run(self, context: dict[str, Any]) -> dict[str, Any]:
         """
         Core business logic for analytics queries.
         
@@ -46,7 +107,7 @@ class AnalyticsAgent(BaseAgent):
         auth_header = self.get_auth_header(context)
         user_role = self.get_user_role(context)
         
-        logger.info(f"[{trace_id[:8]}] AnalyticsAgent handling intent: {intent}")
+        logger.info("[%s] AnalyticsAgent handling intent: %s", trace_id[:8], intent)
         
         # Require authentication
         if not auth_header:
@@ -57,7 +118,7 @@ class AnalyticsAgent(BaseAgent):
             )
         
         # Check role authorization (ADMIN/OPERATOR only)
-        if user_role not in ("ADMIN", "OPERATOR"):
+        if user_role not in _PRIVILEGED_ROLES:
             return self.error_response(
                 message=f"Access denied. Analytics requires ADMIN or OPERATOR role (your role: {user_role}).",
                 trace_id=trace_id,
@@ -65,28 +126,32 @@ class AnalyticsAgent(BaseAgent):
             )
         
         # Route to appropriate analytics function
-        if intent == "analytics_stress_index":
-            return await self._handle_stress_index(context)
-        
-        elif intent == "analytics_alerts":
-            return await self._handle_alerts(context)
-        
-        elif intent == "analytics_what_if":
-            return await self._handle_what_if(context)
-        
-        else:
-            return self.error_response(
-                message=f"Unknown analytics intent: {intent}",
+        handler = self._dispatch.get(intent)
+        if handler is not None:
+            return await handler(
+                context,
                 trace_id=trace_id,
-                error_type="UnknownIntent"
+                entities=entities,
+                auth_header=auth_header,
+                user_role=user_role
             )
+        
+        return self.error_response(
+            message=f"Unknown analytics intent: {intent}",
+            trace_id=trace_id,
+            error_type="UnknownIntent"
+        )
     
-    async def _handle_stress_index(self, context: Dict[str, Any]) -> Dict[str, Any]:
+    async def _handle_stress_index(
+        self,
+        context: dict[str, Any],
+        *,
+        trace_id: str,
+        entities: dict[str, Any],
+        auth_header: str,
+        user_role: str
+    ) -> dict[str, Any]:
         """Handle stress index computation request."""
-        trace_id = self.get_trace_id(context)
-        entities = self.get_entities(context)
-        auth_header = self.get_auth_header(context)
-        user_role = self.get_user_role(context)
         
         # Extract parameters
         terminal = entities.get("terminal")
@@ -104,10 +169,8 @@ class AnalyticsAgent(BaseAgent):
             )
         
         try:
-            from app.analytics.stress_index import compute_stress_index
-            
             # Compute stress index
-            result = await compute_stress_index(
+            result = await _stress_fn()(
                 terminal=terminal,
                 target_date=target_date,
                 gate=gate,
@@ -124,9 +187,8 @@ class AnalyticsAgent(BaseAgent):
             
             message = self._format_stress_message(terminal, stress_index, level, result)
             
-            # Build proofs
+            # Build proofs (trace_id is added by success_response)
             proofs = {
-                "trace_id": trace_id,
                 "user_role": user_role,
                 "sources": result.get("data_quality", {}).get("sources", []),
                 "data_quality": result.get("data_quality", {}).get("mode", "mvp")
@@ -140,19 +202,23 @@ class AnalyticsAgent(BaseAgent):
             )
         
         except Exception as e:
-            logger.exception(f"[{trace_id[:8]}] Stress index computation failed: {e}")
+            logger.exception("[%s] Stress index computation failed: %s", trace_id[:8], e)
             return self.error_response(
                 message="Failed to compute stress index. Please try again.",
                 trace_id=trace_id,
                 error_type=type(e).__name__
             )
     
-    async def _handle_alerts(self, context: Dict[str, Any]) -> Dict[str, Any]:
+    async def _handle_alerts(
+        self,
+        context: dict[str, Any],
+        *,
+        trace_id: str,
+        entities: dict[str, Any],
+        auth_header: str,
+        user_role: str
+    ) -> dict[str, Any]:
         """Handle proactive alerts generation request."""
-        trace_id = self.get_trace_id(context)
-        entities = self.get_entities(context)
-        auth_header = self.get_auth_header(context)
-        user_role = self.get_user_role(context)
         
         # Extract parameters
         terminal = entities.get("terminal")
@@ -169,10 +235,8 @@ class AnalyticsAgent(BaseAgent):
             )
         
         try:
-            from app.analytics.proactive_alerts import generate_alerts
-            
             # Generate alerts
-            alerts = await generate_alerts(
+            alerts = await _alerts_fn()(
                 terminal=terminal,
                 target_date=target_date,
                 context={
@@ -194,11 +258,10 @@ class AnalyticsAgent(BaseAgent):
                 "summary": self._summarize_alerts(alerts)
             }
             
-            # Build proofs
+            # Build proofs (trace_id is added by success_response)
             proofs = {
-                "trace_id": trace_id,
                 "user_role": user_role,
-                "sources": ["stress_index", "capacity_data", "traffic_forecast", "anomalies"]
+                "sources": _ALERTS_SOURCES
             }
             
             return self.success_response(
@@ -209,19 +272,23 @@ class AnalyticsAgent(BaseAgent):
             )
         
         except Exception as e:
-            logger.exception(f"[{trace_id[:8]}] Alert generation failed: {e}")
+            logger.exception("[%s] Alert generation failed: %s", trace_id[:8], e)
             return self.error_response(
                 message="Failed to generate alerts. Please try again.",
                 trace_id=trace_id,
                 error_type=type(e).__name__
             )
     
-    async def _handle_what_if(self, context: Dict[str, Any]) -> Dict[str, Any]:
+    async def _handle_what_if(
+        self,
+        context: dict[str, Any],
+        *,
+        trace_id: str,
+        entities: dict[str, Any],
+        auth_header: str,
+        user_role: str
+    ) -> dict[str, Any]:
         """Handle what-if simulation request."""
-        trace_id = self.get_trace_id(context)
-        entities = self.get_entities(context)
-        auth_header = self.get_auth_header(context)
-        user_role = self.get_user_role(context)
         message_text = self.get_message(context)
         
         # Extract parameters
@@ -245,10 +312,8 @@ class AnalyticsAgent(BaseAgent):
         scenario["date"] = target_date
         
         try:
-            from app.analytics.what_if_simulation import simulate_scenario
-            
             # Run simulation
-            result = await simulate_scenario(
+            result = await _simulate_fn()(
                 scenario=scenario,
                 context={
                     "trace_id": trace_id,
@@ -259,9 +324,8 @@ class AnalyticsAgent(BaseAgent):
             # Format message
             message = self._format_simulation_message(scenario, result)
             
-            # Build proofs
+            # Build proofs (trace_id is added by success_response)
             proofs = {
-                "trace_id": trace_id,
                 "user_role": user_role,
                 "confidence": result.get("confidence", "medium"),
                 "data_quality": result.get("data_quality", {}).get("mode", "mvp")
@@ -275,7 +339,7 @@ class AnalyticsAgent(BaseAgent):
             )
         
         except Exception as e:
-            logger.exception(f"[{trace_id[:8]}] What-if simulation failed: {e}")
+            logger.exception("[%s] What-if simulation failed: %s", trace_id[:8], e)
             return self.error_response(
                 message="Failed to run simulation. Please try again.",
                 trace_id=trace_id,
@@ -291,51 +355,51 @@ class AnalyticsAgent(BaseAgent):
         terminal: str,
         stress_index: float,
         level: str,
-        result: Dict[str, Any]
+        result: dict[str, Any]
     ) -> str:
         """Format stress index result message."""
-        emoji = {"low": "✓", "medium": "⚠", "high": "⚠️", "critical": "🚨"}.get(level, "•")
+        emoji = _STRESS_EMOJI.get(level, _DEFAULT_EMOJI)
         
-        message = f"{emoji} Terminal {terminal} Stress Index: {stress_index}/100 ({level.upper()})\n\n"
+        parts = [f"{emoji} Terminal {terminal} Stress Index: {stress_index}/100 ({level.upper()})\n\n"]
         
         # Add top drivers
         drivers = result.get("drivers", {})
         if drivers:
-            message += "**Key Drivers:**\n"
+            parts.append("**Key Drivers:**\n")
             for driver, value in drivers.items():
                 driver_name = driver.replace("_", " ").title()
-                message += f"• {driver_name}: {value:.0f}/100\n"
+                parts.append(f"• {driver_name}: {value:.0f}/100\n")
         
         # Add top recommendation
         recommendations = result.get("recommendations", [])
         if recommendations:
-            message += f"\n**Recommendation:** {recommendations[0]}"
+            parts.append(f"\n**Recommendation:** {recommendations[0]}")
         
-        return message
+        return "".join(parts)
     
-    def _format_alerts_message(self, terminal: str, alerts: List[Dict[str, Any]]) -> str:
+    def _format_alerts_message(self, terminal: str, alerts: list[dict[str, Any]]) -> str:
         """Format alerts list message."""
         count = len(alerts)
         
         if count == 0:
             return f"✓ No active alerts for terminal {terminal}. Operations normal."
         
-        message = f"⚠ {count} alert(s) for terminal {terminal}:\n\n"
+        parts = [f"⚠ {count} alert(s) for terminal {terminal}:\n\n"]
         
         for i, alert in enumerate(alerts[:5], 1):  # Show first 5
             severity = alert.get("severity", "unknown").upper()
             title = alert.get("title", "Unknown alert")
-            message += f"{i}. [{severity}] {title}\n"
+            parts.append(f"{i}. [{severity}] {title}\n")
         
         if count > 5:
-            message += f"\n... and {count - 5} more alert(s)"
+            parts.append(f"\n... and {count - 5} more alert(s)")
         
-        return message
+        return "".join(parts)
     
     def _format_simulation_message(
         self,
-        scenario: Dict[str, Any],
-        result: Dict[str, Any]
+        scenario: dict[str, Any],
+        result: dict[str, Any]
     ) -> str:
         """Format simulation result message."""
         scenario_type = scenario.get("type", "unknown")
@@ -344,56 +408,49 @@ class AnalyticsAgent(BaseAgent):
         deltas = result.get("deltas", {})
         
         stress_delta = deltas.get("stress_index", 0)
-        arrow = "↓" if stress_delta < 0 else "↑" if stress_delta > 0 else "→"
+        arrow = _TREND_ARROWS[(stress_delta > 0) - (stress_delta < 0)]
         
-        message = f"📊 Simulation Results:\n\n"
-        message += f"**Scenario:** {scenario_type.replace('_', ' ').title()}\n"
-        message += f"**Baseline Stress:** {baseline.get('stress_index', 0)}/100\n"
-        message += f"**Simulated Stress:** {simulated.get('stress_index', 0)}/100 {arrow}\n"
-        message += f"**Change:** {stress_delta:+.1f} points\n\n"
+        parts = [
+            "📊 Simulation Results:\n\n",
+            f"**Scenario:** {scenario_type.replace('_', ' ').title()}\n",
+            f"**Baseline Stress:** {baseline.get('stress_index', 0)}/100\n",
+            f"**Simulated Stress:** {simulated.get('stress_index', 0)}/100 {arrow}\n",
+            f"**Change:** {stress_delta:+.1f} points\n\n",
+        ]
         
         # Add top recommendation
         recommendations = result.get("recommendations", [])
         if recommendations:
-            message += f"**Key Recommendation:** {recommendations[0]}"
+            parts.append(f"**Key Recommendation:** {recommendations[0]}")
         
-        return message
+        return "".join(parts)
     
-    def _summarize_alerts(self, alerts: List[Dict[str, Any]]) -> Dict[str, Any]:
+    def _summarize_alerts(self, alerts: list[dict[str, Any]]) -> dict[str, Any]:
         """Summarize alerts by type and severity."""
-        by_type = {}
-        by_severity = {"low": 0, "medium": 0, "high": 0, "critical": 0}
-        
-        for alert in alerts:
-            alert_type = alert.get("type", "unknown")
-            severity = alert.get("severity", "medium")
-            
-            by_type[alert_type] = by_type.get(alert_type, 0) + 1
-            by_severity[severity] = by_severity.get(severity, 0) + 1
+        by_type = Counter(alert.get("type", "unknown") for alert in alerts)
+        by_severity = Counter(alert.get("severity", "medium") for alert in alerts)
         
         return {
-            "by_type": by_type,
-            "by_severity": by_severity
+            "by_type": dict(by_type),
+            "by_severity": {"low": 0, "medium": 0, "high": 0, "critical": 0, **by_severity}
         }
     
     def _parse_scenario_from_message(
         self,
         message: str,
-        entities: Dict[str, Any]
-    ) -> Optional[Dict[str, Any]]:
+        entities: dict[str, Any]
+    ) -> Optional[dict[str, Any]]:
         """Parse scenario type and parameters from user message."""
-        import re
-        
         message_lower = message.lower()
         
         # Shift demand scenario
         if "shift" in message_lower or "move" in message_lower:
             # Extract percentage
-            pct_match = re.search(r"(\d+)\s*%", message)
+            pct_match = _PCT_RE.search(message)
             percentage = int(pct_match.group(1)) if pct_match else 20
             
             # Extract source/target terminals
-            terminal_matches = re.findall(r"terminal\s+([A-Z])", message, re.IGNORECASE)
+            terminal_matches = _TERM_RE.findall(message)
             if len(terminal_matches) >= 2:
                 return {
                     "type": "shift_demand",
@@ -407,7 +464,7 @@ class AnalyticsAgent(BaseAgent):
             gate = entities.get("gate")
             
             # Extract duration
-            hours_match = re.search(r"(\d+)\s*hours?", message_lower)
+            hours_match = _HOURS_RE.search(message_lower)
             duration_hours = int(hours_match.group(1)) if hours_match else 2
             
             if gate:
@@ -420,7 +477,7 @@ class AnalyticsAgent(BaseAgent):
         # Add capacity scenario
         if "add" in message_lower and ("slot" in message_lower or "capacity" in message_lower):
             # Extract number of slots
-            slots_match = re.search(r"(\d+)\s*slot", message_lower)
+            slots_match = _SLOT_RE.search(message_lower)
             additional_slots = int(slots_match.group(1)) if slots_match else 10
             
             return {
@@ -12,12 +12,60 @@ Uses REAL->MVP fallback strategy:
 """
 
 import logging
-from typing import Dict, Any, Optional, List
+import functools
+from typing import Any, Optional
+
+import httpx
 
 from app.agents.base_agent import BaseAgent
+from app.models.loader import get_model, list_models, add_reload_listener
+from app.tools.nest_client import get_client, NEST_BACKEND_URL
 
 logger = logging.getLogger(__name__)
 
+# Roles allowed to use this agent
+_PRIVILEGED_ROLES = frozenset(("ADMIN", "OPERATOR"))
+
+# Status codes meaning the NestJS anomalies endpoint is not implemented
+_STATUS_NOT_FOUND = frozenset({404, 501})
+
+# Static parts of the MVP fallback response (shared, treat as read-only)
+_MVP_MESSAGE = "Anomaly detection feature is not yet available."
+_MVP_MISSING_ENDPOINTS = (
+    "GET /anomalies - Anomaly detection endpoint",
+    "OR anomaly_model in model registry"
+)
+_MVP_SUGGESTED_ACTION = "Contact system administrator to enable anomaly detection"
+
+
+# NestJS anomalies endpoint (sources shared, treat as read-only)
+_ANOMALIES_URL = f"{NEST_BACKEND_URL}/anomalies"
+_ANOMALIES_SOURCES = (_ANOMALIES_URL,)
+
+
+@functools.cache
+def _get_anomaly_model():
+    """
+    Return the anomaly_model instance if the model registry marks it available, else None.
+    
+    Availability is fixed for the life of the process, so the registry is
+    scanned once. The cached instance is dropped whenever the registry
+    reloads or closes anomaly_model (see _on_model_reload).
+    """
+    info = list_models().get("anomaly_model")
+    if info and info.get("available"):
+        return get_model("anomaly_model")
+    return None
+
+
+def _on_model_reload(name: str) -> None:
+    """Model registry reload listener: forget a reloaded or closed anomaly_model."""
+    if name == "anomaly_model":
+        _get_anomaly_model.cache_clear()
+
+
+add_reload_listener(_on_model_reload)
+
 
 class AnomalyAgent(BaseAgent):
     """
@@ -25,8 +73,10 @@ class AnomalyAgent(BaseAgent):
     
     Intent mapping: anomaly_detection -> AnomalyAgent
     """
+    
+    __slots__ = ()
 
-    async def run(self, context: Dict[str, Any]) -> Dict[str, Any]:
+    async def run(self, context: dict[str, Any]) -> dict[str, Any]:
         """
         Core business logic for anomaly queries.
         
@@ -37,6 +87,7 @@ class AnomalyAgent(BaseAgent):
             Structured response with message, data, and proofs
         """
         trace_id = self.get_trace_id(context)
+        request_id = trace_id[:8]
         entities = self.get_entities(context)
         auth_header = self.get_auth_header(context)
         user_role = self.get_user_role(context)
@@ -50,7 +101,7 @@ class AnomalyAgent(BaseAgent):
             )
         
         # Check role authorization (ADMIN/OPERATOR only)
-        if user_role not in ("ADMIN", "OPERATOR"):
+        if user_role not in _PRIVILEGED_ROLES:
             return self.error_response(
                 message=f"Access denied. Anomaly detection requires ADMIN or OPERATOR role (your role: {user_role}).",
                 trace_id=trace_id,
@@ -64,13 +115,9 @@ class AnomalyAgent(BaseAgent):
         
         # Try to use anomaly model if available
         try:
-            from app.models.loader import get_model, list_models
+            model = _get_anomaly_model()
             
-            available_models = list_models()
-            
-            if "anomaly_model" in available_models and available_models["anomaly_model"].get("available"):
-                model = get_model("anomaly_model")
-                
+            if model is not None:
                 model_input = {
                     "terminal": terminal,
                     "carrier_id": carrier_id,
@@ -103,30 +150,31 @@ class AnomalyAgent(BaseAgent):
                     )
         
         except Exception as e:
-            logger.warning(f"[{trace_id[:8]}] Anomaly model not available: {e}")
+            logger.warning("[%s] Anomaly model not available: %s", request_id, e)
         
         # Try NestJS endpoint
         try:
-            from app.tools.nest_client import get_client, NEST_BASE_URL
-            import httpx
-            
             client = get_client()
             
-            params = {}
-            if terminal:
-                params["terminal"] = terminal
-            if carrier_id:
-                params["carrier_id"] = carrier_id
-            params["days"] = days
-            params["limit"] = 50
+            # Optional filters are dropped when empty; days/limit are always set
+            params = {
+                **{
+                    key: value
+                    for key, value in (("terminal", terminal), ("carrier_id", carrier_id))
+                    if value
+                },
+                "days": days,
+                "limit": 50,
+            }
             
-            headers = {}
-            if auth_header:
-                headers["Authorization"] = auth_header
-            headers["x-request-id"] = trace_id[:8]
+            # auth_header is guaranteed by the check at the top of run()
+            headers = {
+                "Authorization": auth_header,
+                "x-request-id": request_id
+            }
             
             response = await client.get(
-                f"{NEST_BASE_URL}/anomalies",
+                _ANOMALIES_URL,
                 params=params,
                 headers=headers,
                 timeout=5.0
@@ -158,25 +206,25 @@ class AnomalyAgent(BaseAgent):
                         "days": days
                     },
                     trace_id=trace_id,
-                    sources=[f"{NEST_BASE_URL}/anomalies"],
+                    sources=_ANOMALIES_SOURCES,
                     backend="nestjs"
                 )
             
-            elif response.status_code in (404, 501):
+            elif response.status_code in _STATUS_NOT_FOUND:
                 # Endpoint not implemented
                 pass
         
         except httpx.TimeoutException:
-            logger.warning(f"[{trace_id[:8]}] Anomalies endpoint timeout")
+            logger.warning("[%s] Anomalies endpoint timeout", request_id)
         except Exception as e:
-            logger.warning(f"[{trace_id[:8]}] Anomalies endpoint not available: {e}")
+            logger.warning("[%s] Anomalies endpoint not available: %s", request_id, e)
         
         # MVP Fallback
         return self._mvp_response(trace_id, terminal, carrier_id, days)
     
     def _format_anomalies_message(
         self,
-        data: Dict[str, Any],
+        data: dict[str, Any],
         terminal: Optional[str],
         days: int
     ) -> str:
@@ -189,27 +237,28 @@ class AnomalyAgent(BaseAgent):
         if count == 0:
             return f"No anomalies detected for {location} in the last {days} days. Everything looks normal!"
         
-        message = f"Found {count} anomaly(ies) for {location} in the last {days} days:"
+        parts = [f"Found {count} anomaly(ies) for {location} in the last {days} days:"]
         
-        # Group by type
+        # Single pass: group by type and collect the 3 most recent entries
         by_type = {}
-        for anomaly in anomalies:
+        recent = []
+        for i, anomaly in enumerate(anomalies):
             atype = anomaly.get("type", "unknown")
             by_type[atype] = by_type.get(atype, 0) + 1
+            if i < 3:
+                desc = anomaly.get("description") or anomaly.get("message", "Anomaly detected")
+                timestamp = anomaly.get("timestamp", "")
+                recent.append(f"\n• [{timestamp}] {desc}")
         
-        message += "\n\nBreakdown by type:"
+        parts.append("\n\nBreakdown by type:")
         for atype, cnt in by_type.items():
-            message += f"\n• {atype}: {cnt}"
+            parts.append(f"\n• {atype}: {cnt}")
         
-        # Show top 3 most recent
-        if anomalies:
-            message += "\n\nMost recent:"
-            for anomaly in anomalies[:3]:
-                desc = anomaly.get("description") or anomaly.get("message", "Anomaly detected")
-                timestamp = anomaly.get("timestamp", "")
-                message += f"\n• [{timestamp}] {desc}"
+        # Show top 3 most recent (count > 0 here, so there is at least one)
+        parts.append("\n\nMost recent:")
+        parts.extend(recent)
         
-        return message
+        return "".join(parts)
     
     def _mvp_response(
         self,
@@ -217,15 +266,8 @@ class AnomalyAgent(BaseAgent):
         terminal: Optional[str],
         carrier_id: Optional[str],
         days: int
-    ) -> Dict[str, Any]:
+    ) -> dict[str, Any]:
         """Return MVP fallback response when backend not available."""
-        message = "Anomaly detection feature is not yet available."
-        
-        missing_endpoints = [
-            "GET /anomalies - Anomaly detection endpoint",
-            "OR anomaly_model in model registry"
-        ]
-        
         data = {
             "status": "not_implemented",
             "reason": "Backend anomaly detection service not configured",
@@ -234,12 +276,12 @@ class AnomalyAgent(BaseAgent):
                 "carrier_id": carrier_id,
                 "days": days
             },
-            "required_endpoints": missing_endpoints,
-            "suggested_action": "Contact system administrator to enable anomaly detection"
+            "required_endpoints": _MVP_MISSING_ENDPOINTS,
+            "suggested_action": _MVP_SUGGESTED_ACTION
         }
         
         return {
-            "message": message,
+            "message": _MVP_MESSAGE,
             "data": data,
             "proofs": {
                 "trace_id": trace_id,
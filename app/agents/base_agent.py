@@ -5,11 +5,51 @@ All specialized agents inherit from this base class.
 Defines common interface and behavior for agent execution.
 """
 
+import sys
+import asyncio
 import logging
-from typing import Dict, Any, Optional
+from types import MappingProxyType
+from typing import Dict, Any, List, Mapping, NamedTuple, Optional
 
 logger = logging.getLogger(__name__)
 
+# Status/error values shared by every error and validation response
+_ERR_EXECUTION = sys.intern("execution_failed")
+_ERR_VALIDATION = sys.intern("validation_failed")
+_STATUS_FAILED = sys.intern("failed")
+
+
+class AgentContext(NamedTuple):
+    """Request fields unpacked once from the orchestrator context."""
+    trace_id: str
+    entities: Dict[str, Any]
+    auth_header: Optional[str]
+    user_role: str
+    user_id: Optional[int]
+    message: str
+    history: List[Dict[str, Any]]
+
+
+def _build_exec_error(agent_name: str, trace_id: Optional[str], exc: Exception) -> Dict[str, Any]:
+    """
+    Log an unhandled agent exception and build the generic error response.
+    
+    Kept out of BaseAgent.execute so the except block only passes plain
+    values (same payload as error_response()).
+    """
+    logger.exception("%s execution failed: %s", agent_name, exc)
+    
+    if trace_id:
+        proofs = {"trace_id": trace_id, "status": _STATUS_FAILED}
+    else:
+        proofs = {"status": _STATUS_FAILED}
+    
+    return {
+        "message": "I encountered an unexpected error. Please try again.",
+        "data": {"error": _ERR_EXECUTION, "error_type": type(exc).__name__},
+        "proofs": proofs
+    }
+
 
 class BaseAgent:
     """
@@ -19,7 +59,12 @@ class BaseAgent:
     - Standard execute() method that orchestrator calls
     - run() method that child classes must implement
     - Helper methods for response formatting
+    
+    Agents are stateless singletons; subclasses should declare __slots__
+    (empty unless they keep instance state) so instances carry no __dict__.
     """
+    
+    __slots__ = ()
 
     async def execute(self, context: Dict[str, Any]) -> Dict[str, Any]:
         """
@@ -43,13 +88,30 @@ class BaseAgent:
         try:
             return await self.run(context)
         except Exception as e:
-            logger.exception(f"{self.__class__.__name__} execution failed: {e}")
-            trace_id = context.get("trace_id", "unknown")
-            return self.error_response(
-                message="I encountered an unexpected error. Please try again.",
-                trace_id=trace_id,
-                error_type=type(e).__name__
-            )
+            return _build_exec_error(type(self).__name__, context.get("trace_id", "unknown"), e)
+
+    @classmethod
+    async def execute_many(
+        cls,
+        agents: List["BaseAgent"],
+        context: Dict[str, Any]
+    ) -> List[Dict[str, Any]]:
+        """
+        Execute several agents concurrently for the same user turn.
+        
+        The context is unpacked once and handed to every agent as a shared
+        read-only view, so agents neither repeat the fallback lookups nor
+        need defensive copies. Errors are handled per agent by execute().
+        
+        Args:
+            agents: Agent instances to run
+            context: Full context dictionary from orchestrator
+        
+        Returns:
+            One response per agent, in the same order as agents
+        """
+        shared = cls._freeze_context(context)
+        return list(await asyncio.gather(*(agent.execute(shared) for agent in agents)))
 
     async def run(self, context: Dict[str, Any]) -> Dict[str, Any]:
         """
@@ -86,15 +148,16 @@ class BaseAgent:
         Returns:
             Structured success response
         """
-        proofs = {}
+        # extra_proofs is a fresh dict per call, so it can be returned as-is
         if trace_id:
-            proofs["trace_id"] = trace_id
-        proofs.update(extra_proofs)
+            proofs = {"trace_id": trace_id, **extra_proofs}
+        else:
+            proofs = extra_proofs or None
         
         return {
             "message": message,
             "data": data,
-            "proofs": proofs if proofs else None
+            "proofs": proofs
         }
 
     def validation_error(
@@ -119,7 +182,7 @@ class BaseAgent:
             Structured validation error response
         """
         data = {
-            "error": "validation_failed",
+            "error": _ERR_VALIDATION,
             "suggestion": suggestion
         }
         
@@ -129,10 +192,10 @@ class BaseAgent:
         if example:
             data["example"] = example
         
-        proofs = {}
         if trace_id:
-            proofs["trace_id"] = trace_id
-        proofs["validation"] = "failed"
+            proofs = {"trace_id": trace_id, "validation": _STATUS_FAILED}
+        else:
+            proofs = {"validation": _STATUS_FAILED}
         
         return {
             "message": f"{message}\n\n{suggestion}",
@@ -159,17 +222,15 @@ class BaseAgent:
         Returns:
             Structured error response
         """
-        data = {"error": "execution_failed"}
-        
         if error_type:
-            data["error_type"] = error_type
-        
-        data.update(extra_data)
+            data = {"error": _ERR_EXECUTION, "error_type": error_type, **extra_data}
+        else:
+            data = {"error": _ERR_EXECUTION, **extra_data}
         
-        proofs = {}
         if trace_id:
-            proofs["trace_id"] = trace_id
-        proofs["status"] = "failed"
+            proofs = {"trace_id": trace_id, "status": _STATUS_FAILED}
+        else:
+            proofs = {"status": _STATUS_FAILED}
         
         return {
             "message": message,
@@ -181,6 +242,42 @@ class BaseAgent:
     # Helper Methods for Context Extraction
     # ========================================================================
 
+    @staticmethod
+    def _unpack(context: Mapping[str, Any]) -> AgentContext:
+        """
+        Extract all common fields from context in one pass.
+        
+        Same fallbacks as the individual get_* helpers below.
+        
+        Args:
+            context: Full context dictionary from orchestrator
+        
+        Returns:
+            AgentContext with trace_id, entities, auth_header, user_role,
+            user_id, message and history
+        """
+        get = context.get
+        return AgentContext(
+            get("trace_id", "unknown"),
+            get("entities", {}),
+            get("auth_header") or get("authorization") or get("Authorization"),
+            get("user_role", "UNKNOWN"),
+            get("user_id"),
+            get("message", ""),
+            get("history", [])
+        )
+
+    @staticmethod
+    def _freeze_context(context: Mapping[str, Any]) -> Mapping[str, Any]:
+        """
+        Return a read-only view of context with the common fields resolved.
+        
+        The unpacked fields (e.g. auth_header from any of its aliases) are
+        written under their canonical keys, so get_* and _unpack hit on the
+        first lookup.
+        """
+        return MappingProxyType({**context, **BaseAgent._unpack(context)._asdict()})
+
     def get_trace_id(self, context: Dict[str, Any]) -> str:
         """Extract trace_id from context, with fallback."""
         return context.get("trace_id", "unknown")
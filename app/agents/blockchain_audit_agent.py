@@ -14,10 +14,37 @@ Uses REAL->MVP fallback strategy:
 import logging
 from typing import Dict, Any, Optional
 
+from fastapi import HTTPException
+
 from app.agents.base_agent import BaseAgent
 
 logger = logging.getLogger(__name__)
 
+# Blockchain tooling is optional; probe it once at import instead of per request
+try:
+    from app.tools.blockchain_tool import verify_blockchain_integrity
+    from app.tools.blockchain_service_client import is_endpoint_missing
+    _BLOCKCHAIN_AVAILABLE = True
+    _BLOCKCHAIN_IMPORT_ERROR = None
+except ImportError as e:
+    verify_blockchain_integrity = None
+    is_endpoint_missing = None
+    _BLOCKCHAIN_AVAILABLE = False
+    _BLOCKCHAIN_IMPORT_ERROR = e
+
+# Chain metadata copied into proofs["blockchain"] (missing keys become None)
+_CHAIN_KEYS = ("mode", "chain_id", "contract", "tx_hash", "block")
+
+# Static parts of the "not enabled" response (shared, treat as read-only)
+_NOT_ENABLED_MESSAGE = "Blockchain audit feature is not yet enabled."
+_NOT_ENABLED_REQUIRED_SETUP = (
+    "Blockchain node integration",
+    "Smart contract deployment for audit trail",
+    "Backend endpoint: POST /blockchain/audit",
+    "Blockchain verification service"
+)
+_NOT_ENABLED_SUGGESTED_ACTION = "Contact system administrator to enable blockchain audit trail"
+
 
 class BlockchainAuditAgent(BaseAgent):
     """
@@ -39,10 +66,11 @@ class BlockchainAuditAgent(BaseAgent):
         Returns:
             Structured response with message, data, and proofs
         """
-        trace_id = self.get_trace_id(context)
-        entities = self.get_entities(context)
-        auth_header = self.get_auth_header(context)
-        user_role = self.get_user_role(context)
+        ctx = self._unpack(context)
+        trace_id = ctx.trace_id
+        auth_header = ctx.auth_header
+        user_role = ctx.user_role
+        request_id = trace_id[:8]
         
         # Require authentication
         if not auth_header:
@@ -60,7 +88,8 @@ class BlockchainAuditAgent(BaseAgent):
                 error_type="Forbidden"
             )
         
-        # Extract entities
+        # Extract entities (only once the caller is authorized)
+        entities = ctx.entities
         booking_ref = entities.get("booking_ref")
         transaction_id = entities.get("transaction_id")
         
@@ -74,54 +103,24 @@ class BlockchainAuditAgent(BaseAgent):
                 trace_id=trace_id
             )
         
-        # REAL Mode: Try blockchain tool/service
+        # Blockchain tool not installed: feature not enabled
+        if not _BLOCKCHAIN_AVAILABLE:
+            logger.warning("[%s] Blockchain tool not available: %s", request_id, _BLOCKCHAIN_IMPORT_ERROR)
+            return self._feature_not_enabled_response(trace_id, booking_ref, transaction_id)
+        
+        # REAL Mode: Try blockchain tool/service (only the call is guarded)
         try:
-            from app.tools.blockchain_tool import verify_blockchain_integrity
-            from fastapi import HTTPException
-            
-            # Call blockchain verification
             result = await verify_blockchain_integrity(
                 booking_ref=booking_ref,
                 transaction_id=transaction_id,
                 auth_header=auth_header,
-                trace_id=trace_id
+                request_id=request_id
             )
-            
-            # Format message based on verification result
-            message = self._format_audit_message(result, booking_ref or transaction_id)
-            
-            # Build comprehensive proofs
-            proofs = {
-                "trace_id": trace_id,
-                "request_id": trace_id[:8],
-                "user_role": user_role,
-                "sources": ["blockchain_service"],
-                "verified": result.get("verified", False)
-            }
-            
-            # Add blockchain metadata to proofs
-            chain_info = result.get("chain", {})
-            if chain_info:
-                proofs["blockchain"] = {
-                    "mode": chain_info.get("mode"),
-                    "chain_id": chain_info.get("chain_id"),
-                    "contract": chain_info.get("contract"),
-                    "tx_hash": chain_info.get("tx_hash"),
-                    "block": chain_info.get("block")
-                }
-            
-            return {
-                "message": message,
-                "data": result,
-                "proofs": proofs
-            }
         
         except HTTPException as e:
             # Check if endpoint missing (404/405/501)
-            from app.tools.blockchain_service_client import is_endpoint_missing
-            
             if is_endpoint_missing(e):
-                logger.info(f"[{trace_id[:8]}] Blockchain service not implemented")
+                logger.info("[%s] Blockchain service not implemented", request_id)
                 return self._feature_not_enabled_response(trace_id, booking_ref, transaction_id)
             
             # Other HTTP errors (auth, connection, etc.)
@@ -132,17 +131,37 @@ class BlockchainAuditAgent(BaseAgent):
                 status_code=e.status_code
             )
         
-        except ImportError as e:
-            logger.warning(f"[{trace_id[:8]}] Blockchain tool not available: {e}")
-            return self._feature_not_enabled_response(trace_id, booking_ref, transaction_id)
-        
         except Exception as e:
-            logger.exception(f"[{trace_id[:8]}] Blockchain verification error: {e}")
+            logger.exception("[%s] Blockchain verification error: %s", request_id, e)
             return self.error_response(
                 message="Failed to verify blockchain audit trail. Please try again.",
                 trace_id=trace_id,
                 error_type=type(e).__name__
             )
+        
+        # Format message based on verification result
+        message = self._format_audit_message(result, booking_ref or transaction_id)
+        
+        # Build comprehensive proofs
+        proofs = {
+            "trace_id": trace_id,
+            "request_id": request_id,
+            "user_role": user_role,
+            "sources": ["blockchain_service"],
+            "verified": result.get("verified", False)
+        }
+        
+        # Add blockchain metadata to proofs (the tool may report "chain" as a
+        # bare chain id rather than a dict)
+        chain_info = result.get("chain")
+        if chain_info and isinstance(chain_info, dict):
+            proofs["blockchain"] = dict(zip(_CHAIN_KEYS, map(chain_info.get, _CHAIN_KEYS)))
+        
+        return {
+            "message": message,
+            "data": result,
+            "proofs": proofs
+        }
     
     def _format_audit_message(
         self,
@@ -176,15 +195,6 @@ class BlockchainAuditAgent(BaseAgent):
         transaction_id: Optional[str]
     ) -> Dict[str, Any]:
         """Return response when blockchain feature not enabled."""
-        message = "Blockchain audit feature is not yet enabled."
-        
-        required_setup = [
-            "Blockchain node integration",
-            "Smart contract deployment for audit trail",
-            "Backend endpoint: POST /blockchain/audit",
-            "Blockchain verification service"
-        ]
-        
         data = {
             "status": "not_enabled",
             "reason": "Blockchain integration not configured",
@@ -192,12 +202,12 @@ class BlockchainAuditAgent(BaseAgent):
                 "booking_ref": booking_ref,
                 "transaction_id": transaction_id
             },
-            "required_setup": required_setup,
-            "suggested_action": "Contact system administrator to enable blockchain audit trail"
+            "required_setup": _NOT_ENABLED_REQUIRED_SETUP,
+            "suggested_action": _NOT_ENABLED_SUGGESTED_ACTION
         }
         
         return {
-            "message": message,
+            "message": _NOT_ENABLED_MESSAGE,
             "data": data,
             "proofs": {
                 "trace_id": trace_id,
@@ -11,13 +11,21 @@ Responsibilities:
 IMPORTANT: Does NOT handle persistence (NestJS backend handles that via chat.py)
 """
 
+import os
+import time
+import asyncio
+import hashlib
 import logging
-from typing import Dict, Any, List, Optional, Union
+from dataclasses import dataclass
+from operator import itemgetter
+from typing import Dict, Any, List, Optional, Tuple, Union
 from fastapi import HTTPException
 
 from app.agents.base_agent import BaseAgent
 # Use absolute import to be robust regardless of app/tools/__init__.py
 from app.tools.booking_service_client import (
+    BookingStatus,
+    INCLUDE_RAW_PAYLOAD,
     get_booking_status,
     get_bookings_batch,
     BOOKING_SERVICE_URL,
@@ -27,6 +35,171 @@ from app.tools.booking_service_client import (
 
 logger = logging.getLogger(__name__)
 
+# Multi-ref lookups: up to this many refs are fetched concurrently with
+# single-ref calls; larger lists go to the batch endpoint (if enabled)
+SMALL_BATCH_THRESHOLD = int(os.getenv("BOOKING_SMALL_BATCH_THRESHOLD", "8"))
+USE_BATCH_ENDPOINT = os.getenv("BOOKING_USE_BATCH_ENDPOINT", "true").lower() in ("true", "1", "yes")
+
+# Single-booking status cache (seconds; 0 disables)
+BOOKING_CACHE_TTL = float(os.getenv("BOOKING_CACHE_TTL", "15"))
+BOOKING_CACHE_MAXSIZE = int(os.getenv("BOOKING_CACHE_MAXSIZE", "1024"))
+
+# Booking service status code -> (user-facing message, error_type); 404 is
+# handled separately because its message includes the booking refs
+_SERVICE_ERROR_MESSAGES = {
+    401: ("Your session has expired. Please log in again to check booking status.", "Unauthorized"),
+    403: ("You don't have permission to access this booking information.", "Forbidden"),
+    503: ("The booking service is temporarily unavailable. Please try again in a moment.", "ServiceUnavailable"),
+}
+_DEFAULT_SERVICE_ERROR = (
+    "I couldn't retrieve booking information at this time. Please try again later.",
+    "ServiceError"
+)
+
+# Normalized booking fields (see booking_service_client._normalize_booking),
+# fetched in one call when formatting messages
+_BOOKING_FIELDS = ("booking_ref", "status", "terminal", "gate", "slot_time", "last_update")
+_booking_fields = itemgetter(*_BOOKING_FIELDS)
+
+# Proof sources for batch responses (shared across responses, treat as read-only)
+_BATCH_SOURCES = (
+    {"type": "booking_service", "service": BOOKING_SERVICE_URL, "endpoint": BOOKING_BATCH_STATUS_PATH},
+)
+
+
+def _status_sources(booking_refs: List[str]) -> tuple:
+    """Proof sources for single-ref status calls, one concrete endpoint per ref."""
+    return tuple(
+        {
+            "type": "booking_service",
+            "service": BOOKING_SERVICE_URL,
+            "endpoint": BOOKING_STATUS_PATH.format(booking_ref=booking_ref)
+        }
+        for booking_ref in booking_refs
+    )
+
+
+@dataclass
+class BookingQuery:
+    """Per-request fields threaded from run() into the booking handlers."""
+    __slots__ = ("auth_header", "terminal", "gate", "trace_id", "request_id", "user_role")
+    
+    auth_header: str
+    terminal: Optional[str]
+    gate: Optional[str]
+    trace_id: str
+    request_id: str
+    user_role: str
+
+
+# ============================================================================
+# Booking Status TTL Cache
+# ============================================================================
+
+# (booking_ref, auth_hash) -> (expires_at, booking_data); insertion-ordered
+_booking_cache: Dict[Tuple[str, str], Tuple[float, BookingStatus]] = {}
+
+# Per-key locks so concurrent misses for the same key share one backend call
+_booking_locks: Dict[Tuple[str, str], "_KeyLock"] = {}
+
+
+class _KeyLock:
+    """A per-key lock and the number of requests holding or awaiting it."""
+    
+    __slots__ = ("lock", "waiters")
+    
+    def __init__(self):
+        self.lock = asyncio.Lock()
+        self.waiters = 0
+
+
+def _cache_lookup(key: Tuple[str, str]) -> Optional[BookingStatus]:
+    """Return cached booking data for key if present and not expired."""
+    entry = _booking_cache.get(key)
+    if entry is None:
+        return None
+    if entry[0] <= time.monotonic():
+        _booking_cache.pop(key, None)
+        return None
+    return entry[1]
+
+
+async def _get_booking_status_cached(
+    booking_ref: str,
+    auth_header: str,
+    request_id: str
+) -> Tuple[BookingStatus, bool]:
+    """
+    Get booking status through the TTL cache.
+    
+    Entries are keyed by booking ref and a hash of the Authorization header,
+    so one user's cached result is never served to another. Errors are not
+    cached.
+    
+    Args:
+        booking_ref: Booking reference to query
+        auth_header: Authorization header
+        request_id: Short request ID for tracing
+    
+    Returns:
+        Tuple of (booking data, cache_hit)
+    
+    Raises:
+        HTTPException: On booking service errors
+    """
+    if BOOKING_CACHE_TTL <= 0:
+        booking_data = await get_booking_status(
+            booking_ref=booking_ref,
+            auth_header=auth_header,
+            request_id=request_id
+        )
+        return booking_data, False
+    
+    auth_hash = hashlib.blake2b(auth_header.encode(), digest_size=8).hexdigest()
+    key = (booking_ref, auth_hash)
+    
+    cached = _cache_lookup(key)
+    if cached is not None:
+        return cached, True
+    
+    # The entry stays registered until its last waiter leaves; a released
+    # lock is briefly unlocked before a queued waiter reacquires it
+    key_lock = _booking_locks.get(key)
+    if key_lock is None:
+        key_lock = _booking_locks[key] = _KeyLock()
+    key_lock.waiters += 1
+    
+    try:
+        async with key_lock.lock:
+            # Another request may have filled the entry while we waited
+            cached = _cache_lookup(key)
+            if cached is not None:
+                return cached, True
+            
+            booking_data = await get_booking_status(
+                booking_ref=booking_ref,
+                auth_header=auth_header,
+                request_id=request_id
+            )
+            
+            # Evict oldest entries once full
+            while len(_booking_cache) >= BOOKING_CACHE_MAXSIZE:
+                _booking_cache.pop(next(iter(_booking_cache)))
+            _booking_cache[key] = (time.monotonic() + BOOKING_CACHE_TTL, booking_data)
+            return booking_data, False
+    finally:
+        key_lock.waiters -= 1
+        if key_lock.waiters == 0 and _booking_locks.get(key) is key_lock:
+            del _booking_locks[key]
+
+
+def clear_booking_cache():
+    """
+    Clear cached booking statuses. Useful for testing.
+    """
+    _booking_cache.clear()
+    _booking_locks.clear()
+
 
 class BookingAgent(BaseAgent):
     """
@@ -55,11 +228,21 @@ class BookingAgent(BaseAgent):
         Returns:
             Structured response with message, data, and proofs
         """
-        # Extract context using BaseAgent helpers
-        trace_id = self.get_trace_id(context)
-        entities = self.get_entities(context)
-        user_role = self.get_user_role(context)
-        auth_header = self.get_auth_header(context)
+        # Extract context in one pass using BaseAgent helper
+        ctx = self._unpack(context)
+        trace_id = ctx.trace_id
+        entities = ctx.entities
+        user_role = ctx.user_role
+        auth_header = ctx.auth_header
+        request_id = trace_id[:8]
+        
+        # Validate auth header first so unauthenticated requests skip entity parsing
+        if not auth_header:
+            return self.error_response(
+                message="Authentication required to check booking status. Please ensure you're logged in.",
+                trace_id=trace_id,
+                error_type="Unauthorized"
+            )
         
         # Extract and validate booking reference(s)
         booking_refs = self._extract_booking_refs(entities)
@@ -73,38 +256,32 @@ class BookingAgent(BaseAgent):
                 trace_id=trace_id
             )
         
-        # Validate auth header
-        if not auth_header:
-            return self.error_response(
-                message="Authentication required to check booking status. Please ensure you're logged in.",
-                trace_id=trace_id,
-                error_type="Unauthorized"
-            )
-        
         # Log minimal info (privacy: no full message)
         ref_count = len(booking_refs) if isinstance(booking_refs, list) else 1
-        logger.info(f"[{trace_id[:8]}] BookingAgent processing {ref_count} ref(s)")
+        logger.info("[%s] BookingAgent processing %d ref(s)", request_id, ref_count)
         
-        # Extract optional entities
-        terminal = entities.get("terminal")
-        gate = entities.get("gate")
+        # Per-request fields shared by the handlers (incl. optional entities)
+        query = BookingQuery(
+            auth_header=auth_header,
+            terminal=entities.get("terminal"),
+            gate=entities.get("gate"),
+            trace_id=trace_id,
+            request_id=request_id,
+            user_role=user_role
+        )
         
         # Query booking service (handles single or multiple refs)
         try:
             if isinstance(booking_refs, list):
-                return await self._handle_multiple_bookings(
-                    booking_refs, auth_header, terminal, gate, trace_id, user_role
-                )
+                return await self._handle_multiple_bookings(booking_refs, query)
             else:
-                return await self._handle_single_booking(
-                    booking_refs, auth_header, terminal, gate, trace_id, user_role
-                )
+                return await self._handle_single_booking(booking_refs, query)
         except HTTPException as e:
             # Convert HTTP exceptions to user-friendly messages
-            return self._handle_service_error(e, booking_refs, trace_id)
+            return self._handle_service_error(e, booking_refs, trace_id, request_id)
         except Exception as e:
             # Unexpected errors
-            logger.exception(f"[{trace_id[:8]}] Unexpected error in BookingAgent: {e}")
+            logger.exception("[%s] Unexpected error in BookingAgent: %s", request_id, e)
             return self.error_response(
                 message="I encountered an unexpected error while checking booking status. Please try again.",
                 trace_id=trace_id,
@@ -123,28 +300,30 @@ class BookingAgent(BaseAgent):
         """
         booking_ref = entities.get("booking_ref")
         
-        if not booking_ref:
+        if booking_ref is None:
             return None
         
-        # Handle both single string and list
+        # Common case: a single plain string (exact type check, no MRO walk)
+        if booking_ref.__class__ is str:
+            ref = booking_ref.strip()
+            return ref.upper() if ref else None
+        
         if isinstance(booking_ref, list):
-            # Filter out empty strings and normalize
-            refs = [ref.strip().upper() for ref in booking_ref if ref and ref.strip()]
-            return refs if refs else None
-        elif isinstance(booking_ref, str):
-            ref = booking_ref.strip().upper()
-            return ref if ref else None
+            # Strip once, drop empties, normalize
+            refs = [ref.upper() for ref in (r.strip() for r in booking_ref if r) if ref]
+            return refs or None
+        
+        # str subclasses
+        if isinstance(booking_ref, str):
+            ref = booking_ref.strip()
+            return ref.upper() if ref else None
         
         return None
 
     async def _handle_single_booking(
         self,
         booking_ref: str,
-        auth_header: str,
-        terminal: Optional[str],
-        gate: Optional[str],
-        trace_id: str,
-        user_role: str
+        query: BookingQuery
     ) -> Dict[str, Any]:
         """
         Handle single booking reference query.
@@ -152,29 +331,24 @@ class BookingAgent(BaseAgent):
         
         Args:
             booking_ref: Booking reference to query
-            auth_header: Authorization header
-            terminal: Optional terminal filter
-            gate: Optional gate filter
-            trace_id: Request trace ID
-            user_role: User role
+            query: Per-request auth, filters and tracing fields
         
         Returns:
             Structured response with booking data
         """
-        # Call real booking service
-        booking_data = await get_booking_status(
-            booking_ref=booking_ref,
-            auth_header=auth_header,
-            request_id=trace_id[:8]
+        # Call real booking service (served from cache for repeat queries)
+        booking_data, cache_hit = await _get_booking_status_cached(
+            booking_ref, query.auth_header, query.request_id
         )
         
         # Build user-facing message
+        ref, status, term, gate_name, slot, last_update = _booking_fields(booking_data)
         message = (
-            f"Booking {booking_data['booking_ref']} is currently {booking_data['status']}.\n"
-            f"Terminal: {booking_data['terminal']}\n"
-            f"Gate: {booking_data['gate']}\n"
-            f"Slot Time: {booking_data['slot_time']}\n"
-            f"Last Update: {booking_data['last_update']}"
+            f"Booking {ref} is currently {status}.\n"
+            f"Terminal: {term}\n"
+            f"Gate: {gate_name}\n"
+            f"Slot Time: {slot}\n"
+            f"Last Update: {last_update}"
         )
         
         # Build structured response
@@ -189,100 +363,149 @@ class BookingAgent(BaseAgent):
                 "last_update": booking_data["last_update"]
             },
             "proofs": {
-                "trace_id": trace_id,
-                "sources": [
-                    {
-                        "type": "booking_service",
-                        "service": BOOKING_SERVICE_URL,
-                        "endpoint": BOOKING_STATUS_PATH.format(
-                            booking_ref=booking_ref
-                        )
-                    }
-                ],
-                "request_id": trace_id[:8],
-                "user_role": user_role
+                "trace_id": query.trace_id,
+                "sources": _status_sources([booking_ref]),
+                "request_id": query.request_id,
+                "user_role": query.user_role,
+                "cache_hit": cache_hit
             }
         }
 
     async def _handle_multiple_bookings(
         self,
         booking_refs: List[str],
-        auth_header: str,
-        terminal: Optional[str],
-        gate: Optional[str],
-        trace_id: str,
-        user_role: str
+        query: BookingQuery
     ) -> Dict[str, Any]:
         """
         Handle multiple booking references query.
-        Calls real booking service batch API.
+        Calls real booking service batch API for large lists, otherwise fans
+        out concurrent single-ref calls and reports per-ref failures.
         
         Args:
             booking_refs: List of booking references to query
-            auth_header: Authorization header
-            terminal: Optional terminal filter
-            gate: Optional gate filter
-            trace_id: Request trace ID
-            user_role: User role
+            query: Per-request auth, filters and tracing fields
         
         Returns:
             Structured response with multiple booking data
         """
-        # Call real booking service batch endpoint
-        bookings_data = await get_bookings_batch(
-            booking_refs=booking_refs,
-            auth_header=auth_header,
-            request_id=trace_id[:8]
-        )
+        failed: List[Dict[str, Any]] = []
+        
+        if USE_BATCH_ENDPOINT and len(booking_refs) > SMALL_BATCH_THRESHOLD:
+            # Call real booking service batch endpoint
+            bookings_data = await get_bookings_batch(
+                booking_refs=booking_refs,
+                auth_header=query.auth_header,
+                request_id=query.request_id
+            )
+            sources = _BATCH_SOURCES
+        else:
+            # Concurrent single-ref calls (~1 round trip instead of N)
+            bookings_data, failed = await self._fetch_bookings_concurrently(
+                booking_refs, query.auth_header, query.request_id
+            )
+            sources = _status_sources(booking_refs)
         
         # Build user-facing message
         message_parts = [f"Found {len(bookings_data)} booking(s):\n"]
         
+        append = message_parts.append
         for booking in bookings_data:
-            message_parts.append(
-                f"• {booking['booking_ref']}: {booking['status']} "
-                f"(Terminal {booking['terminal']}, Gate {booking['gate']}, {booking['slot_time']})"
-            )
+            ref, status, term, gate_name, slot, _ = _booking_fields(booking)
+            append(f"• {ref}: {status} (Terminal {term}, Gate {gate_name}, {slot})")
+        
+        if failed:
+            failed_refs = ", ".join(f["booking_ref"] for f in failed)
+            message_parts.append(f"\nCould not retrieve {len(failed)} booking(s): {failed_refs}")
         
         message = "\n".join(message_parts)
         
+        # Normalized bookings already have exactly the BookingStatus keys;
+        # only project them when the client attaches the raw payload
+        if INCLUDE_RAW_PAYLOAD:
+            bookings = [dict(zip(_BOOKING_FIELDS, _booking_fields(b))) for b in bookings_data]
+        else:
+            bookings = bookings_data
+        
         # Build structured response
         return {
             "message": message,
             "data": {
                 "booking_refs": booking_refs,
-                "bookings": [
-                    {
-                        "booking_ref": b["booking_ref"],
-                        "status": b["status"],
-                        "terminal": b["terminal"],
-                        "gate": b["gate"],
-                        "slot_time": b["slot_time"],
-                        "last_update": b["last_update"]
-                    }
-                    for b in bookings_data
-                ],
-                "count": len(bookings_data)
+                "bookings": bookings,
+                "count": len(bookings_data),
+                "failed": failed
             },
             "proofs": {
-                "trace_id": trace_id,
-                "sources": [
-                    {
-                        "type": "booking_service",
-                        "service": BOOKING_SERVICE_URL,
-                        "endpoint": BOOKING_BATCH_STATUS_PATH
-                    }
-                ],
-                "request_id": trace_id[:8],
-                "user_role": user_role
+                "trace_id": query.trace_id,
+                "sources": sources,
+                "request_id": query.request_id,
+                "user_role": query.user_role
             }
         }
 
+    async def _fetch_bookings_concurrently(
+        self,
+        booking_refs: List[str],
+        auth_header: str,
+        request_id: str
+    ) -> Tuple[List[BookingStatus], List[Dict[str, Any]]]:
+        """
+        Fetch each booking reference concurrently via the single-ref endpoint.
+        
+        Args:
+            booking_refs: List of booking references to query
+            auth_header: Authorization header
+            request_id: Short request ID for tracing
+        
+        Returns:
+            Tuple of (bookings found, failures as {booking_ref, error_type, status_code})
+        
+        Raises:
+            HTTPException: If every lookup failed (first error, so the caller
+                maps it to a user-friendly message as for a single booking)
+        """
+        results = await asyncio.gather(
+            *(
+                get_booking_status(
+                    booking_ref=ref,
+                    auth_header=auth_header,
+                    request_id=request_id
+                )
+                for ref in booking_refs
+            ),
+            return_exceptions=True
+        )
+        
+        bookings_data = []
+        failed = []
+        first_error = None
+        
+        for ref, result in zip(booking_refs, results):
+            if isinstance(result, BaseException):
+                if first_error is None:
+                    first_error = result
+                failed.append({
+                    "booking_ref": ref,
+                    "error_type": type(result).__name__,
+                    "status_code": getattr(result, "status_code", None)
+                })
+            else:
+                bookings_data.append(result)
+        
+        if not bookings_data and first_error is not None:
+            raise first_error
+        
+        if failed:
+            logger.warning("[%s] %d/%d booking lookups failed", request_id, len(failed), len(booking_refs))
+        
+        return bookings_data, failed
+
     def _handle_service_error(
         self,
         http_exception: HTTPException,
         booking_refs: Union[str, List[str]],
-        trace_id: str
+        trace_id: str,
+        request_id: str
     ) -> Dict[str, Any]:
         """
         Convert HTTP exceptions from booking service to user-friendly messages.
@@ -291,34 +514,25 @@ class BookingAgent(BaseAgent):
             http_exception: HTTPException from booking service
             booking_refs: Booking reference(s) that were queried
             trace_id: Request trace ID
+            request_id: Short request ID (trace_id[:8])
         
         Returns:
             User-friendly error response
         """
         status_code = http_exception.status_code
         
-        # Map HTTP status codes to user-friendly messages
-        if status_code == 401:
-            message = "Your session has expired. Please log in again to check booking status."
-            error_type = "Unauthorized"
-        elif status_code == 403:
-            message = "You don't have permission to access this booking information."
-            error_type = "Forbidden"
-        elif status_code == 404:
+        # Map HTTP status codes to user-friendly messages (404 names the refs)
+        if status_code == 404:
             if isinstance(booking_refs, list):
                 refs_str = ", ".join(booking_refs)
                 message = f"One or more bookings not found: {refs_str}. Please check the booking references."
             else:
                 message = f"Booking {booking_refs} not found. Please check the booking reference."
             error_type = "NotFound"
-        elif status_code == 503:
-            message = "The booking service is temporarily unavailable. Please try again in a moment."
-            error_type = "ServiceUnavailable"
         else:
-            message = "I couldn't retrieve booking information at this time. Please try again later."
-            error_type = "ServiceError"
+            message, error_type = _SERVICE_ERROR_MESSAGES.get(status_code, _DEFAULT_SERVICE_ERROR)
         
-        logger.warning(f"[{trace_id[:8]}] Booking service error {status_code}: {http_exception.detail}")
+        logger.warning("[%s] Booking service error %s: %s", request_id, status_code, http_exception.detail)
         
         return self.error_response(
             message=message,
@@ -348,7 +562,7 @@ class BookingAgent(BaseAgent):
 # Result:
 # {
 #   "message": "Found 2 booking(s):\n• REF123: Confirmed ...\n• REF999: Pending ...",
-#   "data": {"booking_refs": ["REF123", "REF999"], "bookings": [...], "count": 2},
+#   "data": {"booking_refs": ["REF123", "REF999"], "bookings": [...], "count": 2, "failed": []},
 #   "proofs": {...}
 # }
 #
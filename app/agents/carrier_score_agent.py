@@ -13,25 +13,347 @@ Fallback strategy:
 - MVP fallback caps score at 75 and confidence at 0.6 (limited data quality)
 """
 
+import os
 import re
+import json
+import time
+import asyncio
+import hashlib
 import logging
-from typing import Dict, Any, Optional
+from collections import Counter
+from typing import Any, Awaitable, Callable, Dict, Optional, Tuple
+
+import httpx
 from fastapi import HTTPException
 
 from app.agents.base_agent import BaseAgent
+from app.core.circuit_breaker import CircuitBreaker, CircuitOpenError
 from app.tools.carrier_service_client import (
     get_carrier_stats,
     is_endpoint_missing,
     CARRIER_SERVICE_URL,
     CARRIER_STATS_PATH
 )
+from app.tools import booking_service_client
+from app.tools.booking_service_client import BOOKING_SERVICE_URL
 from app.algorithms.carrier_scoring import score_carrier
 
 logger = logging.getLogger(__name__)
 
+# orjson is optional; it decodes large booking lists several times faster
+try:
+    import orjson
+    _json_loads = orjson.loads
+except ImportError:
+    _json_loads = json.loads
+
+# Carrier ID patterns in user messages, fused into one alternation. Group
+# number is the priority: (1) "carrier 123", "transporteur 123", "chauffeur 123",
+# "company 123", "driver id 123"; (2) "ID 123"; (3) "score for 123", "rate 123"
+_CARRIER_ID_RE = re.compile(
+    r"\b(?:"
+    r"(?:carrier|transporteur|chauffeur|company|driver)\s+(?:id\s+)?(\d+)"
+    r"|ID\s+(\d+)"
+    r"|(?:for|score|rate)\s+(\d+)"
+    r")\b",
+    re.IGNORECASE
+)
+
+# Stats lookback window requested from the carrier service
+STATS_WINDOW_DAYS = 90
+
+# MVP fallback endpoint for carrier bookings (may not exist either)
+BOOKING_BY_CARRIER_PATH = os.getenv(
+    "BOOKING_BY_CARRIER_PATH",
+    "/bookings?carrierId={carrier_id}&days={days}"
+)
+_BOOKING_BY_CARRIER_URL = f"{BOOKING_SERVICE_URL}{BOOKING_BY_CARRIER_PATH}"
+
+# Fire the booking-service fallback fetch alongside the carrier stats call so a
+# broken primary costs max(RTT1, RTT2) instead of RTT1 + RTT2
+SPECULATIVE_FALLBACK = os.getenv("SPECULATIVE_FALLBACK", "false").lower() in ("true", "1", "yes")
+
+# Carrier stats cache (seconds; 0 disables)
+CARRIER_STATS_CACHE_TTL = float(os.getenv("CARRIER_STATS_CACHE_TTL", "60"))
+CARRIER_STATS_CACHE_MAXSIZE = int(os.getenv("CARRIER_STATS_CACHE_MAXSIZE", "1024"))
+
+# Circuit breakers: open after N consecutive outage errors, retry after timeout
+CIRCUIT_FAILURE_THRESHOLD = int(os.getenv("CARRIER_CIRCUIT_FAILURE_THRESHOLD", "5"))
+CIRCUIT_RECOVERY_TIMEOUT = float(os.getenv("CARRIER_CIRCUIT_RECOVERY_TIMEOUT", "10"))
+
+
+def _is_carrier_outage(e: BaseException) -> bool:
+    """5xx from carrier service (incl. 503 for timeouts/connection errors), except 501 missing endpoint."""
+    return isinstance(e, HTTPException) and e.status_code >= 500 and not is_endpoint_missing(e)
+
+
+def _is_booking_outage(e: BaseException) -> bool:
+    """Connection/timeout errors or 5xx (except 501 missing endpoint) from booking service."""
+    if isinstance(e, httpx.HTTPStatusError):
+        code = e.response.status_code
+        return code >= 500 and code != 501
+    return isinstance(e, httpx.TransportError)
+
+
+_carrier_breaker = CircuitBreaker(
+    "carrier_service",
+    failure_threshold=CIRCUIT_FAILURE_THRESHOLD,
+    recovery_timeout=CIRCUIT_RECOVERY_TIMEOUT,
+    is_failure=_is_carrier_outage
+)
+_booking_breaker = CircuitBreaker(
+    "booking_service",
+    failure_threshold=CIRCUIT_FAILURE_THRESHOLD,
+    recovery_timeout=CIRCUIT_RECOVERY_TIMEOUT,
+    is_failure=_is_booking_outage
+)
+
+
+# ============================================================================
+# Missing Backend Responses
+# ============================================================================
+
+# Static parts of _return_missing_backend_error, built once at import. Only the
+# leading sentence depends on carrier_id. Shared, treat as read-only.
+_CARRIER_STATS_URL = f"{CARRIER_SERVICE_URL}{CARRIER_STATS_PATH}"
+
+_MISSING_BOTH_MESSAGE_TAIL = (
+    " because BOTH required backend services are not yet available.\n\n"
+    "To enable carrier scoring, please implement at least one of the following:\n\n"
+    "Primary Option:\n"
+    f"• Carrier Stats: GET {_CARRIER_STATS_URL}\n"
+    "  Returns: total_bookings, completed_bookings, cancelled_bookings, no_shows, late_arrivals, delays, anomalies\n\n"
+    "Fallback Option:\n"
+    "• Carrier Bookings: GET {{booking_service}}/bookings?carrierId={{id}}&days={{days}}\n"
+    "  Returns: List of bookings with status field (used for basic scoring)"
+)
+_MISSING_BOTH_ENDPOINTS = (
+    {
+        "service": "carrier_service",
+        "url": _CARRIER_STATS_URL,
+        "description": "Primary: Full carrier statistics endpoint",
+        "priority": "high"
+    },
+    {
+        "service": "booking_service",
+        "path": "/bookings?carrierId={id}&days={days}",
+        "description": "Fallback: Bookings filtered by carrier ID",
+        "priority": "medium"
+    }
+)
+
+_MISSING_ONE_MESSAGE_TAIL = (
+    " because the required backend services are not yet available.\n\n"
+    "To enable carrier scoring, please implement the following backend endpoint:\n"
+    f"• Carrier Stats: GET {_CARRIER_STATS_URL}\n"
+    "  OR\n"
+    "• Carrier Bookings: GET {{booking_service}}/bookings?carrierId={{id}}&days={{days}}"
+)
+_MISSING_ONE_ENDPOINTS = (
+    {
+        "service": "carrier_service",
+        "url": _CARRIER_STATS_URL,
+        "description": "Primary endpoint for carrier statistics"
+    },
+    {
+        "service": "booking_service",
+        "path": "/bookings?carrierId={id}&days={days}",
+        "description": "Alternative: Get bookings by carrier for MVP scoring"
+    }
+)
+
+
+# ============================================================================
+# Carrier Stats Cache
+# ============================================================================
+
+# (carrier_id, window_days, auth_hash) -> (expires_at, stats); insertion-ordered
+_stats_cache: Dict[Tuple[str, int, str], Tuple[float, Dict[str, Any]]] = {}
+
+# In-flight downstream calls: concurrent requests for the same key share one task
+_stats_inflight: Dict[Tuple[str, int, str], "_SharedCall"] = {}
+_bookings_inflight: Dict[Tuple[str, int, str], "_SharedCall"] = {}
+
+
+class _SharedCall:
+    """An in-flight downstream call and the number of requests awaiting it."""
+    
+    __slots__ = ("task", "waiters")
+    
+    def __init__(self, task: asyncio.Future):
+        self.task = task
+        self.waiters = 0
+
+
+async def _coalesced(
+    inflight: Dict[Tuple[str, int, str], _SharedCall],
+    key: Tuple[str, int, str],
+    fetch: Callable[[], Awaitable[Any]]
+) -> Any:
+    """
+    Run fetch() once per key while a call is in flight; everyone awaits it.
+    
+    The shared call runs in its own task and each caller awaits it through
+    asyncio.shield, so cancelling one request never cancels the call other
+    requests are still waiting on. When the last waiter is cancelled the
+    call is cancelled too (e.g. a dropped speculative fallback fetch).
+    Errors are not remembered: once the task finishes the key is free again.
+    """
+    call = inflight.get(key)
+    if call is None:
+        call = _SharedCall(asyncio.ensure_future(fetch()))
+        inflight[key] = call
+        call.task.add_done_callback(lambda t: _release_inflight(inflight, key, call))
+    
+    call.waiters += 1
+    try:
+        return await asyncio.shield(call.task)
+    finally:
+        call.waiters -= 1
+        if call.waiters == 0 and not call.task.done():
+            # Nobody wants the result any more: free the key for new
+            # callers right away and stop the downstream request
+            if inflight.get(key) is call:
+                del inflight[key]
+            call.task.cancel()
+
+
+def _consume_exception(task: asyncio.Future) -> None:
+    """Done callback: mark a task's error retrieved (nobody may await it)."""
+    if not task.cancelled():
+        task.exception()
+
+
+def _release_inflight(
+    inflight: Dict[Tuple[str, int, str], _SharedCall],
+    key: Tuple[str, int, str],
+    call: _SharedCall
+) -> None:
+    """Done callback for _coalesced: free the key and mark the error retrieved."""
+    if inflight.get(key) is call:
+        del inflight[key]
+    _consume_exception(call.task)
+
+
+def _stats_cache_key(
+    carrier_id: str,
+    window_days: int,
+    auth_header: Optional[str]
+) -> Tuple[str, int, str]:
+    """Cache key: carrier, window and a hash of the Authorization header."""
+    auth_hash = hashlib.blake2b((auth_header or "").encode(), digest_size=8).hexdigest()
+    return (carrier_id, window_days, auth_hash)
+
+
+def _lookup_cached_stats(
+    carrier_id: str,
+    window_days: int,
+    auth_header: Optional[str]
+) -> Optional[Dict[str, Any]]:
+    """
+    Synchronous cache probe: fresh cached stats, or None on miss/expiry.
+    
+    Lets callers answer cache hits without creating a coroutine or
+    touching the event loop.
+    """
+    if CARRIER_STATS_CACHE_TTL <= 0:
+        return None
+    
+    key = _stats_cache_key(carrier_id, window_days, auth_header)
+    entry = _stats_cache.get(key)
+    if entry is not None:
+        if entry[0] > time.monotonic():
+            return entry[1]
+        _stats_cache.pop(key, None)
+    return None
+
+
+async def _get_carrier_stats_cached(
+    carrier_id: str,
+    window_days: int,
+    auth_header: Optional[str],
+    request_id: str
+) -> Dict[str, Any]:
+    """
+    Get carrier stats through the TTL cache, sharing in-flight lookups.
+    
+    Keyed by carrier, window and a hash of the Authorization header so one
+    caller's stats are never served to another. Errors are not cached; every
+    request waiting on a failed lookup receives the same exception. In-flight
+    lookups are shared even when the cache is disabled.
+    
+    Args:
+        carrier_id: Carrier identifier
+        window_days: Stats lookback window
+        auth_header: Optional Authorization header
+        request_id: Short request ID for tracing
+    
+    Returns:
+        Carrier stats dict (shared, treat as read-only)
+    
+    Raises:
+        HTTPException: On carrier service errors
+        CircuitOpenError: If the carrier service circuit is open
+    """
+    key = _stats_cache_key(carrier_id, window_days, auth_header)
+    
+    if CARRIER_STATS_CACHE_TTL > 0:
+        entry = _stats_cache.get(key)
+        if entry is not None:
+            if entry[0] > time.monotonic():
+                return entry[1]
+            _stats_cache.pop(key, None)
+    
+    return await _coalesced(
+        _stats_inflight,
+        key,
+        lambda: _fetch_carrier_stats(key, carrier_id, window_days, auth_header, request_id)
+    )
+
+
+async def _fetch_carrier_stats(
+    key: Tuple[str, int, str],
+    carrier_id: str,
+    window_days: int,
+    auth_header: Optional[str],
+    request_id: str
+) -> Dict[str, Any]:
+    """Call the carrier service (through its breaker) and cache the result."""
+    async with _carrier_breaker:
+        stats = await get_carrier_stats(
+            carrier_id=carrier_id,
+            window_days=window_days,
+            auth_header=auth_header,
+            request_id=request_id
+        )
+    
+    if CARRIER_STATS_CACHE_TTL > 0:
+        # Evict oldest entries once full
+        while len(_stats_cache) >= CARRIER_STATS_CACHE_MAXSIZE:
+            _stats_cache.pop(next(iter(_stats_cache)))
+        _stats_cache[key] = (time.monotonic() + CARRIER_STATS_CACHE_TTL, stats)
+    
+    return stats
+
+
+# carrier_id -> (stats, rendered success response) for cache-hit requests. Only
+# valid while the cached stats object is the same one it was rendered from;
+# proofs are copied and stamped with per-request fields on every hit.
+_rendered_responses: Dict[str, Tuple[Dict[str, Any], Dict[str, Any]]] = {}
+
+
+def clear_stats_cache():
+    """
+    Clear cached carrier stats. Useful for testing.
+    """
+    _stats_cache.clear()
+    _rendered_responses.clear()
+
 
 class CarrierScoreAgent(BaseAgent):
     """Agent specialized in carrier reliability scoring and performance analysis."""
+    
+    __slots__ = ()
 
     async def run(self, context: Dict[str, Any]) -> Dict[str, Any]:
         """
@@ -42,12 +364,17 @@ class CarrierScoreAgent(BaseAgent):
         2. Try REAL carrier stats endpoint
         3. If missing (404/405/501) -> try MVP fallback via booking service
         4. If no data at all -> return helpful error
+        
+        With SPECULATIVE_FALLBACK enabled the booking fetch for step 3 starts
+        together with step 2 and is cancelled if the REAL call succeeds.
         """
-        trace_id = self.get_trace_id(context)
-        entities = self.get_entities(context)
-        auth_header = self.get_auth_header(context)
-        message = self.get_message(context)
-        user_role = self.get_user_role(context)
+        ctx = self._unpack(context)
+        trace_id = ctx.trace_id
+        entities = ctx.entities
+        auth_header = ctx.auth_header
+        message = ctx.message
+        user_role = ctx.user_role
+        request_id = trace_id[:8]
         
         # Extract carrier ID
         carrier_id = self._extract_carrier_id(context, entities, message)
@@ -61,16 +388,29 @@ class CarrierScoreAgent(BaseAgent):
                 trace_id=trace_id
             )
         
-        logger.info(f"[{trace_id[:8]}] CarrierScoreAgent processing carrier {carrier_id}")
+        logger.info("[%s] CarrierScoreAgent processing carrier %s", request_id, carrier_id)
+        
+        # Cache hit: answer without any await (no coroutine, no scheduler hop)
+        stats = _lookup_cached_stats(carrier_id, STATS_WINDOW_DAYS, auth_header)
+        if stats is not None:
+            return self._cached_success_response(
+                carrier_id, stats, trace_id, request_id, user_role
+            )
+        
+        # Speculatively start the MVP fallback fetch; only consumed if REAL fails
+        fallback_task = None
+        if SPECULATIVE_FALLBACK:
+            fallback_task = asyncio.ensure_future(
+                self._fetch_carrier_bookings(carrier_id, auth_header)
+            )
+            # If REAL succeeds nobody awaits this; don't leave a failure unread
+            fallback_task.add_done_callback(_consume_exception)
         
         # Strategy: Try REAL first, then MVP fallback
         try:
-            # Attempt REAL carrier stats endpoint
-            stats = await get_carrier_stats(
-                carrier_id=carrier_id,
-                window_days=90,
-                auth_header=auth_header,
-                request_id=trace_id[:8]
+            # Attempt REAL carrier stats endpoint (cached, shared in-flight)
+            stats = await _get_carrier_stats_cached(
+                carrier_id, STATS_WINDOW_DAYS, auth_header, request_id
             )
             
             # Success - calculate score
@@ -88,19 +428,29 @@ class CarrierScoreAgent(BaseAgent):
         except HTTPException as e:
             # Check if endpoint is missing/unimplemented
             if is_endpoint_missing(e):
-                logger.warning(f"[{trace_id[:8]}] Carrier stats endpoint not available, trying MVP fallback")
-                return await self._mvp_fallback(carrier_id, auth_header, trace_id, user_role)
+                logger.warning("[%s] Carrier stats endpoint not available, trying MVP fallback", request_id)
+                return await self._mvp_fallback(carrier_id, auth_header, trace_id, user_role, fallback_task)
             
             # Handle other HTTP errors
             return self._handle_carrier_service_error(e, carrier_id, trace_id)
+        
+        except CircuitOpenError:
+            # Carrier service known to be down: skip straight to MVP fallback
+            logger.warning("[%s] Carrier service circuit open, trying MVP fallback", request_id)
+            return await self._mvp_fallback(carrier_id, auth_header, trace_id, user_role, fallback_task)
             
         except Exception as e:
-            logger.exception(f"[{trace_id[:8]}] Unexpected error in CarrierScoreAgent: {e}")
+            logger.exception("[%s] Unexpected error in CarrierScoreAgent: %s", request_id, e)
             return self.error_response(
                 message="I encountered an unexpected error while calculating carrier score. Please try again.",
                 trace_id=trace_id,
                 error_type=type(e).__name__
             )
+        
+        finally:
+            # Drop the speculative fetch if REAL answered (or failed for good)
+            if fallback_task is not None and not fallback_task.done():
+                fallback_task.cancel()
 
     def _extract_carrier_id(
         self,
@@ -116,85 +466,103 @@ class CarrierScoreAgent(BaseAgent):
         2. entities["carrier_id"]
         3. Parse from message patterns
         """
-        # Check context
-        carrier_id = context.get("carrier_id")
-        if carrier_id:
-            return str(carrier_id)
-        
-        # Check entities
-        carrier_id = entities.get("carrier_id")
-        if carrier_id:
-            return str(carrier_id)
-        
-        # Parse from message
-        # Patterns: "carrier 123", "transporteur 123", "chauffeur 123", "company 123", "ID 123"
-        patterns = [
-            r"\b(?:carrier|transporteur|chauffeur|company|driver)\s+(?:id\s+)?(\d+)\b",
-            r"\bID\s+(\d+)\b",
-            r"\b(?:for|score|rate)\s+(\d+)\b"
-        ]
-        
-        for pattern in patterns:
-            match = re.search(pattern, message, re.IGNORECASE)
-            if match:
+        # Check context, then entities (skip str() when already a string)
+        for carrier_id in (context.get("carrier_id"), entities.get("carrier_id")):
+            if carrier_id:
+                return carrier_id if carrier_id.__class__ is str else str(carrier_id)
+        
+        # Parse from message in a single scan. A higher-priority pattern wins
+        # even if a lower-priority one matches earlier in the message.
+        best = None
+        for match in _CARRIER_ID_RE.finditer(message):
+            group = match.lastindex
+            if group == 1:
                 return match.group(1)
+            if best is None or group < best.lastindex:
+                best = match
         
-        return None
+        return best.group(best.lastindex) if best else None
+
+    async def _fetch_carrier_bookings(
+        self,
+        carrier_id: str,
+        auth_header: Optional[str]
+    ) -> list:
+        """
+        Fetch the carrier's bookings from the booking service (MVP fallback data).
+        
+        Kept separate from scoring so run() can start it speculatively.
+        Concurrent fetches for the same carrier and caller share one request.
+        
+        Raises:
+            httpx.HTTPError: On booking service errors
+            CircuitOpenError: If the booking service circuit is open
+        """
+        key = _stats_cache_key(carrier_id, STATS_WINDOW_DAYS, auth_header)
+        return await _coalesced(
+            _bookings_inflight,
+            key,
+            lambda: self._request_carrier_bookings(carrier_id, auth_header)
+        )
+
+    async def _request_carrier_bookings(
+        self,
+        carrier_id: str,
+        auth_header: Optional[str]
+    ) -> list:
+        """Single booking-service request behind _fetch_carrier_bookings."""
+        url = _BOOKING_BY_CARRIER_URL.format(
+            carrier_id=carrier_id,
+            days=STATS_WINDOW_DAYS
+        )
+        
+        headers = {"Content-Type": "application/json"}
+        if auth_header:
+            headers["Authorization"] = auth_header
+        
+        client = booking_service_client.get_client()
+        async with _booking_breaker:
+            response = await client.get(url, headers=headers)
+            response.raise_for_status()
+        
+        # Decode raw bytes directly (C parser when orjson is installed)
+        bookings_data = _json_loads(response.content)
+        
+        # Extract bookings list (decoders only produce exact list/dict types)
+        data_type = bookings_data.__class__
+        if data_type is list:
+            return bookings_data
+        if data_type is dict:
+            return bookings_data.get("data") or bookings_data.get("bookings") or []
+        return []
 
     async def _mvp_fallback(
         self,
         carrier_id: str,
         auth_header: Optional[str],
         trace_id: str,
-        user_role: str
+        user_role: str,
+        bookings_task: Optional[asyncio.Future] = None
     ) -> Dict[str, Any]:
         """
         MVP fallback when carrier stats endpoint is not available.
         
         Strategy:
         - Try to fetch bookings from booking service filtered by carrier
+          (or await the speculative fetch started by run())
         - Compute basic stats from bookings
         - Cap score at 75 and confidence at 0.6 (limited metrics)
         - If booking service also unavailable, return helpful error
         """
-        logger.info(f"[{trace_id[:8]}] Attempting MVP scoring via booking service")
+        request_id = trace_id[:8]
+        logger.info("[%s] Attempting MVP scoring via booking service", request_id)
         
         try:
             # Try to get bookings for this carrier
-            from app.tools.booking_service_client import (
-                BOOKING_SERVICE_URL,
-                get_client as get_booking_client
-            )
-            import os
-            import httpx
-            
-            # Endpoint for carrier bookings (may not exist either)
-            booking_by_carrier_path = os.getenv(
-                "BOOKING_BY_CARRIER_PATH",
-                "/bookings?carrierId={carrier_id}&days={days}"
-            )
-            url = f"{BOOKING_SERVICE_URL}{booking_by_carrier_path}".format(
-                carrier_id=carrier_id,
-                days=90
-            )
-            
-            headers = {"Content-Type": "application/json"}
-            if auth_header:
-                headers["Authorization"] = auth_header
-            
-            client = get_booking_client()
-            response = await client.get(url, headers=headers)
-            response.raise_for_status()
-            
-            bookings_data = response.json()
-            
-            # Extract bookings list
-            if isinstance(bookings_data, dict):
-                bookings = bookings_data.get("data") or bookings_data.get("bookings") or []
-            elif isinstance(bookings_data, list):
-                bookings = bookings_data
+            if bookings_task is not None:
+                bookings = await bookings_task
             else:
-                bookings = []
+                bookings = await self._fetch_carrier_bookings(carrier_id, auth_header)
             
             # Compute stats from bookings
             stats = self._compute_stats_from_bookings(bookings)
@@ -220,9 +588,9 @@ class CarrierScoreAgent(BaseAgent):
             score_result["data_quality"] = stats.get("data_quality", {})
             
             logger.info(
-                f"[{trace_id[:8]}] MVP fallback score: {score_result['score']:.1f} "
-                f"(capped from {original_score:.1f}), "
-                f"confidence: {score_result['confidence']:.2f} (capped from {original_confidence:.2f})"
+                "[%s] MVP fallback score: %.1f (capped from %.1f), confidence: %.2f (capped from %.2f)",
+                request_id, score_result["score"], original_score,
+                score_result["confidence"], original_confidence
             )
             
             return self._build_success_response(
@@ -235,20 +603,27 @@ class CarrierScoreAgent(BaseAgent):
                 mvp_note="Score computed from booking history with limited metrics (carrier stats service unavailable)"
             )
             
+        except CircuitOpenError:
+            # Booking service known to be down: fail fast
+            logger.warning("[%s] MVP fallback skipped - booking service circuit open", request_id)
+            return self._return_missing_backend_error(carrier_id, trace_id, both_missing=False)
         except httpx.HTTPStatusError as e:
             # Check if booking-by-carrier endpoint is also missing
             if e.response.status_code in (404, 405, 501):
-                logger.warning(f"[{trace_id[:8]}] Booking-by-carrier endpoint also unavailable")
+                logger.warning("[%s] Booking-by-carrier endpoint also unavailable", request_id)
                 return self._return_missing_backend_error(carrier_id, trace_id, both_missing=True)
             # Other HTTP errors from booking service
-            logger.warning(f"[{trace_id[:8]}] MVP fallback failed - booking service error {e.response.status_code}")
+            logger.warning(
+                "[%s] MVP fallback failed - booking service error %s",
+                request_id, e.response.status_code
+            )
             return self._return_missing_backend_error(carrier_id, trace_id, both_missing=False)
         except (httpx.ConnectError, httpx.TimeoutException) as e:
             # Booking service unavailable
-            logger.warning(f"[{trace_id[:8]}] MVP fallback failed - booking service unavailable")
+            logger.warning("[%s] MVP fallback failed - booking service unavailable", request_id)
             return self._return_missing_backend_error(carrier_id, trace_id, both_missing=False)
         except Exception as e:
-            logger.exception(f"[{trace_id[:8]}] MVP fallback error: {e}")
+            logger.exception("[%s] MVP fallback error: %s", request_id, e)
             return self._return_missing_backend_error(carrier_id, trace_id, both_missing=False)
 
     def _compute_stats_from_bookings(self, bookings: list) -> Dict[str, Any]:
@@ -278,17 +653,15 @@ class CarrierScoreAgent(BaseAgent):
                 }
             }
         
-        completed = 0
-        cancelled = 0
+        # Tally raw statuses in one pass, then normalize each distinct value
+        # once (str() + lower() per status kind instead of per booking)
         # MVP: Can't determine no-shows/late-arrivals from just status
         # Would need additional fields
-        
-        for booking in bookings:
-            status = str(booking.get("status", "")).lower()
-            if status in ("completed", "consumed"):
-                completed += 1
-            elif status in ("cancelled", "canceled"):
-                cancelled += 1
+        counts = Counter()
+        for status, n in Counter(booking.get("status", "") for booking in bookings).items():
+            counts[status.lower() if status.__class__ is str else str(status).lower()] += n
+        completed = counts["completed"] + counts["consumed"]
+        cancelled = counts["cancelled"] + counts["canceled"]
         
         return {
             "total_bookings": total,
@@ -369,16 +742,10 @@ class CarrierScoreAgent(BaseAgent):
                 "status": "success"
             })
         elif source == "booking_service_mvp":
-            from app.tools.booking_service_client import BOOKING_SERVICE_URL
-            import os
-            booking_by_carrier_path = os.getenv(
-                "BOOKING_BY_CARRIER_PATH",
-                "/bookings?carrierId={carrier_id}&days={days}"
-            )
             sources.append({
                 "type": "booking_service",
                 "service": BOOKING_SERVICE_URL,
-                "endpoint": booking_by_carrier_path.format(carrier_id=carrier_id, days=90),
+                "endpoint": BOOKING_BY_CARRIER_PATH.format(carrier_id=carrier_id, days=STATS_WINDOW_DAYS),
                 "note": "MVP fallback - carrier service unavailable",
                 "status": "fallback"
             })
@@ -398,6 +765,58 @@ class CarrierScoreAgent(BaseAgent):
             "proofs": proofs
         }
 
+    def _cached_success_response(
+        self,
+        carrier_id: str,
+        stats: Dict[str, Any],
+        trace_id: str,
+        request_id: str,
+        user_role: str
+    ) -> Dict[str, Any]:
+        """
+        Success response for cached stats, reusing the scored/rendered body.
+        
+        Scoring and message building run once per cached stats object; each
+        request gets copies of the cached data and proofs (and their nested
+        containers) with its own trace fields, so callers may modify them.
+        """
+        rendered = _rendered_responses.get(carrier_id)
+        if rendered is None or rendered[0] is not stats:
+            response = self._build_success_response(
+                carrier_id=carrier_id,
+                score_result=score_carrier(stats),
+                trace_id=trace_id,
+                user_role=user_role,
+                source="carrier_service",
+                is_fallback=False
+            )
+            # Evict oldest entries once full
+            while len(_rendered_responses) >= CARRIER_STATS_CACHE_MAXSIZE:
+                _rendered_responses.pop(next(iter(_rendered_responses)))
+            _rendered_responses[carrier_id] = (stats, response)
+        else:
+            response = rendered[1]
+        
+        cached_data = response["data"]
+        data = {
+            **cached_data,
+            "stats": dict(cached_data["stats"]),
+            "components": dict(cached_data["components"]),
+            "reasons": list(cached_data["reasons"])
+        }
+        
+        proofs = response["proofs"].copy()
+        proofs["sources"] = [dict(source) for source in proofs["sources"]]
+        proofs["trace_id"] = trace_id
+        proofs["request_id"] = request_id
+        proofs["user_role"] = user_role
+        
+        return {
+            "message": response["message"],
+            "data": data,
+            "proofs": proofs
+        }
+
     def _handle_carrier_service_error(
         self,
         http_exception: HTTPException,
@@ -436,50 +855,11 @@ class CarrierScoreAgent(BaseAgent):
     ) -> Dict[str, Any]:
         """Return helpful error when backend endpoints are missing."""
         if both_missing:
-            message = (
-                f"I cannot calculate the score for carrier {carrier_id} because BOTH required backend services are not yet available.\n\n"
-                "To enable carrier scoring, please implement at least one of the following:\n\n"
-                f"Primary Option:\n"
-                f"• Carrier Stats: GET {CARRIER_SERVICE_URL}{CARRIER_STATS_PATH}\n"
-                f"  Returns: total_bookings, completed_bookings, cancelled_bookings, no_shows, late_arrivals, delays, anomalies\n\n"
-                "Fallback Option:\n"
-                "• Carrier Bookings: GET {{booking_service}}/bookings?carrierId={{id}}&days={{days}}\n"
-                "  Returns: List of bookings with status field (used for basic scoring)"
-            )
-            missing_endpoints = [
-                {
-                    "service": "carrier_service",
-                    "url": f"{CARRIER_SERVICE_URL}{CARRIER_STATS_PATH}",
-                    "description": "Primary: Full carrier statistics endpoint",
-                    "priority": "high"
-                },
-                {
-                    "service": "booking_service",
-                    "path": "/bookings?carrierId={id}&days={days}",
-                    "description": "Fallback: Bookings filtered by carrier ID",
-                    "priority": "medium"
-                }
-            ]
+            message = f"I cannot calculate the score for carrier {carrier_id}{_MISSING_BOTH_MESSAGE_TAIL}"
+            missing_endpoints = _MISSING_BOTH_ENDPOINTS
         else:
-            message = (
-                f"I cannot calculate the score for carrier {carrier_id} because the required backend services are not yet available.\n\n"
-                "To enable carrier scoring, please implement the following backend endpoint:\n"
-                f"• Carrier Stats: GET {CARRIER_SERVICE_URL}{CARRIER_STATS_PATH}\n"
-                "  OR\n"
-                "• Carrier Bookings: GET {{booking_service}}/bookings?carrierId={{id}}&days={{days}}"
-            )
-            missing_endpoints = [
-                {
-                    "service": "carrier_service",
-                    "url": f"{CARRIER_SERVICE_URL}{CARRIER_STATS_PATH}",
-                    "description": "Primary endpoint for carrier statistics"
-                },
-                {
-                    "service": "booking_service",
-                    "path": "/bookings?carrierId={id}&days={days}",
-                    "description": "Alternative: Get bookings by carrier for MVP scoring"
-                }
-            ]
+            message = f"I cannot calculate the score for carrier {carrier_id}{_MISSING_ONE_MESSAGE_TAIL}"
+            missing_endpoints = _MISSING_ONE_ENDPOINTS
         
         data = {
             "error": "backend_not_available",
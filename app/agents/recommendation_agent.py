@@ -18,6 +18,10 @@ from app.agents.base_agent import BaseAgent
 
 logger = logging.getLogger(__name__)
 
+# Static lines of the recommendations message
+_REASONS_HEADER = "   Reasons:"
+_LOW_CARRIER_SCORE_TIP = "⚠️ Tip: Your carrier score is low. Consider booking earlier slots to avoid delays."
+
 
 class RecommendationAgent(BaseAgent):
     """
@@ -29,6 +33,8 @@ class RecommendationAgent(BaseAgent):
     - slot_recommendation model (primary)
     - carrier_scoring model (for context)
     """
+    
+    __slots__ = ()
 
     async def run(self, context: Dict[str, Any]) -> Dict[str, Any]:
         """
@@ -40,10 +46,12 @@ class RecommendationAgent(BaseAgent):
         Returns:
             Structured response with message, data, and proofs
         """
-        trace_id = self.get_trace_id(context)
-        entities = self.get_entities(context)
-        auth_header = self.get_auth_header(context)
-        user_role = self.get_user_role(context)
+        ctx = self._unpack(context)
+        trace_id = ctx.trace_id
+        entities = ctx.entities
+        auth_header = ctx.auth_header
+        user_role = ctx.user_role
+        request_id = trace_id[:8]
         
         # Require authentication for personalized recommendations
         if not auth_header:
@@ -129,7 +137,7 @@ class RecommendationAgent(BaseAgent):
             )
         
         except ImportError:
-            logger.error(f"[{trace_id[:8]}] Model loader not available")
+            logger.error("[%s] Model loader not available", request_id)
             return self.error_response(
                 message="Recommendation service is currently unavailable. Please try again later.",
                 trace_id=trace_id,
@@ -137,7 +145,7 @@ class RecommendationAgent(BaseAgent):
             )
         
         except Exception as e:
-            logger.exception(f"[{trace_id[:8]}] Recommendation error: {e}")
+            logger.exception("[%s] Recommendation error: %s", request_id, e)
             return self.error_response(
                 message="Failed to generate recommendations. Please try again.",
                 trace_id=trace_id,
@@ -158,7 +166,9 @@ class RecommendationAgent(BaseAgent):
         if count == 0:
             return f"No available slots found for terminal {terminal} on {date}. Please try a different date or terminal."
         
-        message = f"I found {count} recommended slot(s) for terminal {terminal} on {date}:"
+        # Collect lines and join once instead of growing a string with +=
+        parts = [f"I found {count} recommended slot(s) for terminal {terminal} on {date}:"]
+        append = parts.append
         
         # Show top 3 recommendations
         for i, slot in enumerate(recommended[:3], 1):
@@ -166,26 +176,25 @@ class RecommendationAgent(BaseAgent):
             capacity = slot.get("remaining_capacity", slot.get("capacity", ""))
             score = slot.get("rank_score", 0)
             
-            message += f"\n\n{i}. {start_time}"
-            if capacity:
-                message += f" (Capacity: {capacity})"
-            if score:
-                message += f" - Score: {score:.2f}/100"
+            capacity_text = f" (Capacity: {capacity})" if capacity else ""
+            score_text = f" - Score: {score:.2f}/100" if score else ""
+            append("")
+            append(f"{i}. {start_time}{capacity_text}{score_text}")
             
             # Add reasons
             reasons = slot.get("reasons", [])
             if reasons:
-                message += "\n   Reasons:"
-                for reason in reasons[:2]:
-                    message += f"\n   • {reason}"
+                append(_REASONS_HEADER)
+                parts.extend([f"   • {reason}" for reason in reasons[:2]])
         
         # Add carrier-specific advice
         if carrier_id:
             carrier_score = data.get("carrier_context", {}).get("score")
             if carrier_score and carrier_score < 60:
-                message += "\n\n⚠️ Tip: Your carrier score is low. Consider booking earlier slots to avoid delays."
+                append("")
+                append(_LOW_CARRIER_SCORE_TIP)
         
-        return message
+        return "\n".join(parts)
     
     def _backend_unavailable_response(
         self,
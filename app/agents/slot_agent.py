@@ -13,9 +13,11 @@ Fallback strategy:
 """
 
 import re
+import time
 import logging
-from typing import Dict, Any, Optional, List
-from datetime import date, timedelta
+from operator import itemgetter
+from typing import Dict, Any, Optional, List, Tuple
+from datetime import date, datetime, timedelta
 from fastapi import HTTPException
 
 from app.agents.base_agent import BaseAgent
@@ -29,6 +31,118 @@ from app.algorithms.slot_recommender import recommend_slots
 
 logger = logging.getLogger(__name__)
 
+# Terminal patterns in user messages, fused into one alternation. Group number
+# is the priority: (1) "terminal A", "terminale B"; (2) "A terminal";
+# (3) "terminal: C". Wrapped in a lookahead so matches are zero-width and may
+# overlap (e.g. "A terminal B" yields both the group 2 and group 1 match).
+_TERMINAL_RE = re.compile(
+    r"(?="
+    r"\btermin[ae]l?\s+([A-Z])\b"
+    r"|\b([A-Z])\s+terminal\b"
+    r"|\bterminal\s*:\s*([A-Z])\b"
+    r")",
+    re.IGNORECASE
+)
+
+# Recommended slots shown in the message and returned in data
+_MAX_RECOMMENDED_SLOTS = 5
+
+# Fields shown per recommended slot in the message
+_slot_line_fields = itemgetter("start", "end", "gate", "remaining", "capacity")
+
+
+def _format_slot_lines(i: int, slot: Dict[str, Any]) -> str:
+    """
+    Format one recommended slot for the message.
+    
+    Returns:
+        "i. start - end (...)" line, plus an indented line with up to two
+        rank reasons when the recommender gave any
+    """
+    start, end, slot_gate, remaining, capacity = _slot_line_fields(slot)
+    line = f"{i}. {start} - {end} (Gate {slot_gate}, {remaining}/{capacity} available)"
+    rank_reasons = slot.get("rank_reasons")
+    if rank_reasons:
+        return f"{line}\n   → {', '.join(rank_reasons[:2])}"
+    return line
+
+
+# Recommendation keywords ("alternatives" is covered by "alternative")
+_RECOMMEND_RE = re.compile(
+    r"recommend|suggest|alternative|better|best|other options|what else",
+    re.IGNORECASE
+)
+
+# Explicit YYYY-MM-DD date in user messages
+_DATE_RE = re.compile(r"\b(\d{4}-\d{2}-\d{2})\b")
+
+# (day_start, day_end, (today, tomorrow, yesterday)) for the current local
+# day; epoch bounds so the hot path is a float compare. Replaced atomically.
+_iso_day: Tuple[float, float, Tuple[str, str, str]] = (0.0, 0.0, ("", "", ""))
+
+
+def _iso_dates() -> Tuple[str, str, str]:
+    """
+    Today, tomorrow and yesterday as ISO strings (local time).
+    
+    Recomputed only when the clock leaves the cached day (e.g. at midnight).
+    
+    Returns:
+        (today, tomorrow, yesterday)
+    """
+    global _iso_day
+    now = time.time()
+    day_start, day_end, dates = _iso_day
+    if day_start <= now < day_end:
+        return dates
+    
+    today = date.fromtimestamp(now)
+    tomorrow = today + timedelta(days=1)
+    dates = (today.isoformat(), tomorrow.isoformat(), (today - timedelta(days=1)).isoformat())
+    _iso_day = (
+        datetime.combine(today, datetime.min.time()).timestamp(),
+        datetime.combine(tomorrow, datetime.min.time()).timestamp(),
+        dates
+    )
+    return dates
+
+# Static parts of _return_missing_backend_error, built once at import. Only the
+# terminal is interpolated. Shared, treat as read-only.
+_SLOT_AVAILABILITY_URL = SLOT_SERVICE_URL + SLOT_AVAILABILITY_PATH
+
+_MISSING_ENDPOINT_MESSAGE = (
+    "I cannot check slot availability for terminal {terminal} because the slot service API is not yet available.\n\n"
+    "To enable slot availability queries, please implement the following backend endpoint:\n"
+    "• Slot Availability: GET " + _SLOT_AVAILABILITY_URL + "\n"
+    "  Parameters: terminal, date, gate (optional)"
+)
+_MISSING_ENDPOINTS = (
+    {
+        "service": "slot_service",
+        "url": _SLOT_AVAILABILITY_URL,
+        "description": "Endpoint for querying slot availability",
+        "required_params": ["terminal", "date"],
+        "optional_params": ["gate"]
+    },
+)
+
+
+def _tally_capacity(slots: List[Dict[str, Any]]) -> Tuple[int, int]:
+    """
+    Sum remaining and total capacity over slots in a single pass.
+    
+    Returns:
+        (total_remaining, total_capacity); a slot without capacity counts as 1
+    """
+    # Unbound dict.get hoisted out of the loop (slots are decoded JSON dicts)
+    get = dict.get
+    total_remaining = 0
+    total_capacity = 0
+    for slot in slots:
+        total_remaining += get(slot, "remaining", 0)
+        total_capacity += get(slot, "capacity", 1)
+    return total_remaining, total_capacity
+
 
 class SlotAgent(BaseAgent):
     """Agent specialized in slot availability queries and recommendations."""
@@ -72,7 +186,7 @@ class SlotAgent(BaseAgent):
                 error_type="Unauthorized"
             )
         
-        logger.info(f"[{trace_id[:8]}] SlotAgent processing terminal {terminal}, date {date_str}")
+        logger.info("[%s] SlotAgent processing terminal %s, date %s", trace_id[:8], terminal, date_str)
         
         # Check if user wants recommendations
         wants_recommendations = self._wants_recommendations(message)
@@ -87,10 +201,16 @@ class SlotAgent(BaseAgent):
                 request_id=trace_id[:8]
             )
             
+            # Totals are only needed when the user didn't ask for
+            # recommendations; computed once for both the check and response
+            total_remaining = total_capacity = 0
+            if not wants_recommendations:
+                total_remaining, total_capacity = _tally_capacity(slots)
+            
             # Check if we should recommend
             should_recommend = (
                 wants_recommendations or
-                self._has_low_availability(slots)
+                self._has_low_availability(slots, total_remaining, total_capacity)
             )
             
             if should_recommend:
@@ -109,18 +229,20 @@ class SlotAgent(BaseAgent):
                     terminal=terminal,
                     date_str=date_str,
                     trace_id=trace_id,
-                    user_role=user_role
+                    user_role=user_role,
+                    total_remaining=total_remaining,
+                    total_capacity=total_capacity
                 )
             
         except HTTPException as e:
             if is_endpoint_missing(e):
-                logger.warning(f"[{trace_id[:8]}] Slot availability endpoint not available")
+                logger.warning("[%s] Slot availability endpoint not available", trace_id[:8])
                 return self._return_missing_backend_error(terminal, date_str, trace_id)
             
             return self._handle_slot_service_error(e, terminal, trace_id)
             
         except Exception as e:
-            logger.exception(f"[{trace_id[:8]}] Unexpected error in SlotAgent: {e}")
+            logger.exception("[%s] Unexpected error in SlotAgent: %s", trace_id[:8], e)
             return self.error_response(
                 message="I encountered an unexpected error while checking slot availability. Please try again.",
                 trace_id=trace_id,
@@ -129,24 +251,24 @@ class SlotAgent(BaseAgent):
 
     def _extract_terminal(self, entities: Dict[str, Any], message: str) -> Optional[str]:
         """Extract terminal from entities or parse from message."""
-        # Check entities
+        # Check entities (usually already an uppercase letter: skip the copy)
         terminal = entities.get("terminal")
         if terminal:
+            if terminal.__class__ is str and terminal.isupper():
+                return terminal
             return str(terminal).upper()
         
-        # Parse from message: "terminal A", "terminale B", etc.
-        patterns = [
-            r"\btermin[ae]l?\s+([A-Z])\b",
-            r"\b([A-Z])\s+terminal\b",
-            r"\bterminal\s*:\s*([A-Z])\b"
-        ]
-        
-        for pattern in patterns:
-            match = re.search(pattern, message, re.IGNORECASE)
-            if match:
+        # Parse from message in a single scan. A higher-priority pattern wins
+        # even if a lower-priority one matches earlier in the message.
+        best = None
+        for match in _TERMINAL_RE.finditer(message):
+            group = match.lastindex
+            if group == 1:
                 return match.group(1).upper()
+            if best is None or group < best.lastindex:
+                best = match
         
-        return None
+        return best.group(best.lastindex).upper() if best else None
 
     def _extract_date(self, entities: Dict[str, Any], message: str) -> str:
         """
@@ -156,41 +278,43 @@ class SlotAgent(BaseAgent):
         - entities["date_today"], ["date_tomorrow"], ["date_yesterday"]
         - Explicit YYYY-MM-DD in message
         - Default: today
+        
+        Relative dates come from _iso_dates(), cached for the current day.
         """
         # Check entities
         if entities.get("date_today"):
-            return date.today().isoformat()
+            return _iso_dates()[0]
         elif entities.get("date_tomorrow"):
-            return (date.today() + timedelta(days=1)).isoformat()
+            return _iso_dates()[1]
         elif entities.get("date_yesterday"):
             # FIX: Subtract 1 day, not add
-            return (date.today() - timedelta(days=1)).isoformat()
+            return _iso_dates()[2]
         
-        # Parse explicit date from message
-        date_match = re.search(r"\b(\d{4}-\d{2}-\d{2})\b", message)
-        if date_match:
-            return date_match.group(1)
+        # Parse explicit date from message (an ISO date needs a dash, so most
+        # messages skip the regex engine entirely)
+        if "-" in message:
+            date_match = _DATE_RE.search(message)
+            if date_match:
+                return date_match.group(1)
         
         # Default: today
-        return date.today().isoformat()
+        return _iso_dates()[0]
 
     def _wants_recommendations(self, message: str) -> bool:
         """Check if user is asking for recommendations."""
-        keywords = [
-            "recommend", "suggest", "alternative", "better", "best",
-            "other options", "what else", "alternatives"
-        ]
-        message_lower = message.lower()
-        return any(kw in message_lower for kw in keywords)
+        # One case-insensitive scan; no lowered copy of the message
+        return _RECOMMEND_RE.search(message) is not None
 
-    def _has_low_availability(self, slots: List[Dict[str, Any]]) -> bool:
-        """Check if slots have low overall availability."""
+    def _has_low_availability(
+        self,
+        slots: List[Dict[str, Any]],
+        total_remaining: int,
+        total_capacity: int
+    ) -> bool:
+        """Check if slots have low overall availability (totals from _tally_capacity)."""
         if not slots:
             return False
         
-        total_remaining = sum(s.get("remaining", 0) for s in slots)
-        total_capacity = sum(s.get("capacity", 1) for s in slots)
-        
         if total_capacity == 0:
             return False
         
@@ -225,7 +349,7 @@ class SlotAgent(BaseAgent):
                 score_result = score_carrier(stats)
                 carrier_score = score_result["score"]
             except Exception:
-                logger.debug(f"[{trace_id[:8]}] Could not get carrier score for recommendations")
+                logger.debug("[%s] Could not get carrier score for recommendations", trace_id[:8])
         
         # Run recommender
         requested = {
@@ -240,7 +364,8 @@ class SlotAgent(BaseAgent):
             carrier_score=carrier_score
         )
         
-        recommended = result["recommended"]
+        # Slice once; the same top slots feed the message and the payload
+        recommended = result["recommended"][:_MAX_RECOMMENDED_SLOTS]
         # FIX: Proper indentation
         strategy = result["strategy"]
         overall_reasons = result["reasons"]
@@ -249,22 +374,12 @@ class SlotAgent(BaseAgent):
         if not recommended:
             message = f"Unfortunately, there are no available slots at terminal {terminal} on {date_str}."
         else:
-            message_parts = [
-                f"Here are the recommended slots for terminal {terminal} on {date_str}:\n"
-            ]
-            
-            for i, slot in enumerate(recommended[:5], 1):
-                message_parts.append(
-                    f"{i}. {slot['start']} - {slot['end']} "
-                    f"(Gate {slot['gate']}, {slot['remaining']}/{slot['capacity']} available)"
-                )
-                if slot.get("rank_reasons"):
-                    message_parts.append(f"   → {', '.join(slot['rank_reasons'][:2])}")
-            
+            message = (
+                f"Here are the recommended slots for terminal {terminal} on {date_str}:\n\n"
+                + "\n".join(_format_slot_lines(i, slot) for i, slot in enumerate(recommended, 1))
+            )
             if overall_reasons:
-                message_parts.append(f"\nStrategy: {', '.join(overall_reasons)}")
-            
-            message = "\n".join(message_parts)
+                message += f"\n\nStrategy: {', '.join(overall_reasons)}"
         
         # Build data
         data = {
@@ -302,12 +417,11 @@ class SlotAgent(BaseAgent):
         terminal: str,
         date_str: str,
         trace_id: str,
-        user_role: str
+        user_role: str,
+        total_remaining: int,
+        total_capacity: int
     ) -> Dict[str, Any]:
-        """Build simple availability response."""
-        total_remaining = sum(s.get("remaining", 0) for s in slots)
-        total_capacity = sum(s.get("capacity", 1) for s in slots)
-        
+        """Build simple availability response (totals from _tally_capacity)."""
         if not slots:
             message = f"No slots found for terminal {terminal} on {date_str}."
         elif total_remaining == 0:
@@ -377,24 +491,13 @@ class SlotAgent(BaseAgent):
         trace_id: str
     ) -> Dict[str, Any]:
         """Return helpful error when slot availability endpoint missing."""
-        message = (
-            f"I cannot check slot availability for terminal {terminal} because the slot service API is not yet available.\n\n"
-            "To enable slot availability queries, please implement the following backend endpoint:\n"
-            f"• Slot Availability: GET {SLOT_SERVICE_URL}{SLOT_AVAILABILITY_PATH}\n"
-            "  Parameters: terminal, date, gate (optional)"
-        )
+        message = _MISSING_ENDPOINT_MESSAGE.format(terminal=terminal)
         
         data = {
             "error": "backend_not_available",
             "terminal": terminal,
             "date": date_str,
-            "missing_endpoints": [{
-                "service": "slot_service",
-                "url": f"{SLOT_SERVICE_URL}{SLOT_AVAILABILITY_PATH}",
-                "description": "Endpoint for querying slot availability",
-                "required_params": ["terminal", "date"],
-                "optional_params": ["gate"]
-            }],
+            "missing_endpoints": _MISSING_ENDPOINTS,
             "recommendation": "Implement slot availability endpoint to enable this feature"
         }
         
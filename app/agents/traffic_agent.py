@@ -12,13 +12,36 @@ Uses REAL->MVP fallback strategy:
 """
 
 import logging
+import functools
 from typing import Dict, Any, Optional
 
 from app.agents.base_agent import BaseAgent
+from app.models.loader import get_model, list_models
+from app.tools.nest_client import get_client, NEST_BACKEND_URL
 
 logger = logging.getLogger(__name__)
 
 
+@functools.lru_cache(maxsize=1)
+def _traffic_model_available() -> bool:
+    """
+    Whether the model registry marks traffic_model as available.
+    
+    Availability is fixed for the life of the process, so the registry is
+    scanned once. The instance itself is not cached: get_model() always
+    returns the current one, including after a reload.
+    """
+    info = list_models().get("traffic_model")
+    return bool(info and info.get("available"))
+
+
+def clear_cache():
+    """
+    Forget the cached traffic_model availability. Useful for testing.
+    """
+    _traffic_model_available.cache_clear()
+
+
 class TrafficAgent(BaseAgent):
     """
     Agent specialized in handling traffic forecast and congestion queries.
@@ -48,14 +71,10 @@ class TrafficAgent(BaseAgent):
         
         # Try to use traffic model if available
         try:
-            from app.models.loader import get_model, list_models
-            
-            available_models = list_models()
-            
-            if "traffic_model" in available_models and available_models["traffic_model"].get("available"):
-                # Call traffic model
+            if _traffic_model_available():
                 model = get_model("traffic_model")
                 
+                # Call traffic model
                 model_input = {
                     "terminal": terminal,
                     "date": date,
@@ -90,12 +109,10 @@ class TrafficAgent(BaseAgent):
                     )
         
         except Exception as e:
-            logger.warning(f"[{trace_id[:8]}] Traffic model not available: {e}")
+            logger.warning("[%s] Traffic model not available: %s", trace_id[:8], e)
         
         # Try NestJS endpoint
         try:
-            from app.tools.nest_client import get_client, NEST_BASE_URL
-            
             client = get_client()
             
             params = {}
@@ -112,7 +129,7 @@ class TrafficAgent(BaseAgent):
             headers["x-request-id"] = trace_id[:8]
             
             response = await client.get(
-                f"{NEST_BASE_URL}/traffic/forecast",
+                f"{NEST_BACKEND_URL}/traffic/forecast",
                 params=params,
                 headers=headers,
                 timeout=5.0
@@ -130,12 +147,12 @@ class TrafficAgent(BaseAgent):
                     message=message,
                     data=forecast,
                     trace_id=trace_id,
-                    sources=[f"{NEST_BASE_URL}/traffic/forecast"],
+                    sources=[f"{NEST_BACKEND_URL}/traffic/forecast"],
                     backend="nestjs"
                 )
         
         except Exception as e:
-            logger.warning(f"[{trace_id[:8]}] Traffic endpoint not available: {e}")
+            logger.warning("[%s] Traffic endpoint not available: %s", trace_id[:8], e)
         
         # MVP Fallback: Feature not implemented
         return self._mvp_response(trace_id, terminal, date)
@@ -4,11 +4,16 @@ Carrier Scoring Algorithm
 Deterministic algorithm to score carrier reliability and performance.
 Produces a score (0-100), tier (A/B/C/D), components breakdown, and reasons.
 
-No external dependencies or randomness - purely based on statistics.
+No randomness - purely based on statistics. score_carriers_batch and
+score_carriers_arrays score many carriers at once with NumPy.
 """
 
+import bisect
 import logging
-from typing import Dict, Any, List
+import functools
+from typing import Dict, Any, List, Tuple
+
+import numpy as np
 
 logger = logging.getLogger(__name__)
 
@@ -23,12 +28,47 @@ WEIGHT_NO_SHOW_PENALTY = 0.20
 WEIGHT_ANOMALY_PENALTY = 0.15
 WEIGHT_DWELL_EFFICIENCY = 0.10
 
+# Same weights as a vector, in _component_scores order (batch scoring)
+_WEIGHTS = np.array([
+    WEIGHT_COMPLETION_RATE,
+    WEIGHT_ON_TIME_PERFORMANCE,
+    WEIGHT_NO_SHOW_PENALTY,
+    WEIGHT_ANOMALY_PENALTY,
+    WEIGHT_DWELL_EFFICIENCY
+], dtype=np.float64)
+
+# Stats fields read by batch scoring (score_carriers_arrays input keys)
+_BATCH_FIELDS = (
+    "total_bookings",
+    "completed_bookings",
+    "no_shows",
+    "late_arrivals",
+    "avg_delay_minutes",
+    "avg_dwell_minutes",
+    "anomaly_count"
+)
+
 # Thresholds for tier classification
 TIER_A_THRESHOLD = 85  # Excellent
 TIER_B_THRESHOLD = 70  # Good
 TIER_C_THRESHOLD = 50  # Acceptable
 # Below TIER_C = Tier D (Needs Improvement)
 
+# Tier lookup: the number of thresholds <= score indexes the label
+# (bisect_right for one score, np.searchsorted(side="right") for arrays)
+_TIER_THRESHOLDS = (TIER_C_THRESHOLD, TIER_B_THRESHOLD, TIER_A_THRESHOLD)
+_TIER_LABELS = "DCBA"
+_TIER_THRESHOLDS_ARRAY = np.array(_TIER_THRESHOLDS, dtype=np.float64)
+_TIER_LABELS_ARRAY = np.array(list(_TIER_LABELS))
+
+# Tier commentary used as the first reason
+_TIER_MESSAGES = {
+    "A": "Excellent overall performance",
+    "B": "Good performance with room for improvement",
+    "C": "Acceptable performance but needs attention",
+    "D": "Performance needs significant improvement"
+}
+
 # Confidence thresholds based on sample size
 HIGH_CONFIDENCE_BOOKINGS = 50
 LOW_CONFIDENCE_BOOKINGS = 10
@@ -55,16 +95,44 @@ def score_carrier(stats: Dict[str, Any]) -> Dict[str, Any]:
     
     Returns:
         Dict with score, tier, components, reasons, confidence, stats_summary.
+    
+    Results are memoized on the stats values (see _score_carrier_cached);
+    the returned dict and its containers are fresh copies.
     """
-    total = stats.get("total_bookings", 0)
-    completed = stats.get("completed_bookings", 0)
-    cancelled = stats.get("cancelled_bookings", 0)
-    no_shows = stats.get("no_shows", 0)
-    late_arrivals = stats.get("late_arrivals", 0)
-    avg_delay = stats.get("avg_delay_minutes", 0.0)
-    avg_dwell = stats.get("avg_dwell_minutes", 0.0)
-    anomaly_count = stats.get("anomaly_count", 0)
+    result = _score_carrier_cached(
+        stats.get("total_bookings", 0),
+        stats.get("completed_bookings", 0),
+        stats.get("no_shows", 0),
+        stats.get("late_arrivals", 0),
+        stats.get("avg_delay_minutes", 0.0),
+        stats.get("avg_dwell_minutes", 0.0),
+        stats.get("anomaly_count", 0)
+    )
+    return {
+        **result,
+        "components": dict(result["components"]),
+        "reasons": list(result["reasons"]),
+        "stats_summary": dict(result["stats_summary"])
+    }
+
+
+@functools.lru_cache(maxsize=8192, typed=True)
+def _score_carrier_cached(
+    total: int,
+    completed: int,
+    no_shows: int,
+    late_arrivals: int,
+    avg_delay: float,
+    avg_dwell: float,
+    anomaly_count: int
+) -> Dict[str, Any]:
+    """
+    Score a carrier from its individual statistics (memoized).
     
+    Scoring is pure in these values, so repeat calls for unchanged stats are
+    a cache lookup. typed=True keeps e.g. 50 and 50.0 apart because
+    stats_summary echoes the inputs. Shared result, treat as read-only.
+    """
     # Handle edge case: no bookings
     if total == 0:
         return {
@@ -76,44 +144,22 @@ def score_carrier(stats: Dict[str, Any]) -> Dict[str, Any]:
             "stats_summary": {"total_bookings": 0}
         }
     
-    # Calculate rates
-    completion_rate = completed / total
-    no_show_rate = no_shows / total
-    late_rate = late_arrivals / total if completed > 0 else 0.0
-    anomaly_rate = anomaly_count / total
-    
-    # Calculate component scores (0-100 each)
-    components = {}
-    
-    # 1. Completion Rate (30%)
-    completion_score = min(100, (completion_rate / TARGET_COMPLETION_RATE) * 100)
-    components["completion"] = round(completion_score, 2)
-    
-    # 2. On-Time Performance (25%)
-    # Penalize based on late arrivals and average delay
-    on_time_rate = 1.0 - late_rate
-    delay_penalty = min(20, avg_delay / 3.0)  # Max 20 points penalty for delays
-    on_time_score = max(0, min(100, (on_time_rate / TARGET_ON_TIME_RATE) * 100 - delay_penalty))
-    components["on_time"] = round(on_time_score, 2)
-    
-    # 3. No-Show Penalty (20%)
-    # Lower is better
-    no_show_score = max(0, 100 - (no_show_rate / MAX_ACCEPTABLE_NO_SHOW_RATE) * 100)
-    components["no_show"] = round(no_show_score, 2)
-    
-    # 4. Anomaly Penalty (15%)
-    # Lower is better
-    anomaly_score = max(0, 100 - (anomaly_rate / MAX_ACCEPTABLE_ANOMALY_RATE) * 100)
-    components["anomaly"] = round(anomaly_score, 2)
+    # Calculate rates and component scores
+    completion_rate, no_show_rate, late_rate, anomaly_rate = _rates(
+        total, completed, no_shows, late_arrivals, anomaly_count
+    )
+    completion_score, on_time_score, no_show_score, anomaly_score, dwell_score = _component_scores(
+        completion_rate, no_show_rate, late_rate, anomaly_rate, avg_delay, avg_dwell
+    )
     
-    # 5. Dwell Efficiency (10%)
-    # Closer to target is better
-    if avg_dwell > 0:
-        dwell_diff = abs(avg_dwell - TARGET_DWELL_MINUTES)
-        dwell_score = max(0, 100 - (dwell_diff / TARGET_DWELL_MINUTES) * 100)
-    else:
-        dwell_score = 50  # Neutral if no dwell time data
-    components["dwell_efficiency"] = round(dwell_score, 2)
+    # Component scores (0-100 each)
+    components = {
+        "completion": round(completion_score, 2),
+        "on_time": round(on_time_score, 2),
+        "no_show": round(no_show_score, 2),
+        "anomaly": round(anomaly_score, 2),
+        "dwell_efficiency": round(dwell_score, 2)
+    }
     
     # Calculate weighted final score
     final_score = (
@@ -128,14 +174,7 @@ def score_carrier(stats: Dict[str, Any]) -> Dict[str, Any]:
     final_score = max(0.0, min(100.0, final_score))
     
     # Determine tier
-    if final_score >= TIER_A_THRESHOLD:
-        tier = "A"
-    elif final_score >= TIER_B_THRESHOLD:
-        tier = "B"
-    elif final_score >= TIER_C_THRESHOLD:
-        tier = "C"
-    else:
-        tier = "D"
+    tier = _TIER_LABELS[bisect.bisect_right(_TIER_THRESHOLDS, final_score)]
     
     # Calculate confidence based on sample size
     if total >= HIGH_CONFIDENCE_BOOKINGS:
@@ -176,6 +215,181 @@ def score_carrier(stats: Dict[str, Any]) -> Dict[str, Any]:
     }
 
 
+def score_carriers_batch(stats_list: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+    """
+    Score many carriers at once (score and tier only).
+    
+    Transposes the dicts into per-field arrays and scores them with
+    score_carriers_arrays. Scores match score_carrier's "score" and "tier"
+    for the same stats.
+    
+    Args:
+        stats_list: Carrier statistics dicts (same shape as score_carrier).
+    
+    Returns:
+        List of {"score", "tier"} dicts, in input order.
+    """
+    n = len(stats_list)
+    arrays = {
+        field: np.fromiter((stats.get(field, 0) for stats in stats_list), dtype=np.float64, count=n)
+        for field in _BATCH_FIELDS
+    }
+    result = score_carriers_arrays(arrays)
+    
+    return [
+        {"score": round(score, 2), "tier": tier}
+        for score, tier in zip(result["score"].tolist(), result["tier"].tolist())
+    ]
+
+
+def score_carriers_arrays(arrays: Dict[str, np.ndarray]) -> Dict[str, np.ndarray]:
+    """
+    Vectorized scoring over structure-of-arrays carrier statistics.
+    
+    Same formulas as score_carrier, evaluated for all carriers with NumPy
+    element-wise operations (no per-carrier Python code).
+    
+    Args:
+        arrays: One equal-length array per field in _BATCH_FIELDS
+            (total_bookings, completed_bookings, no_shows, late_arrivals,
+            avg_delay_minutes, avg_dwell_minutes, anomaly_count).
+    
+    Returns:
+        Dict with:
+        - score: (N,) final scores, clamped to 0-100 (not rounded)
+        - tier: (N,) tier letters
+        - components: (N, 5) component scores in _WEIGHTS order
+          (all zero for carriers without bookings)
+    """
+    total = np.asarray(arrays["total_bookings"], dtype=np.float64)
+    completed = np.asarray(arrays["completed_bookings"], dtype=np.float64)
+    avg_delay = np.asarray(arrays["avg_delay_minutes"], dtype=np.float64)
+    avg_dwell = np.asarray(arrays["avg_dwell_minutes"], dtype=np.float64)
+    
+    # Carriers without bookings score 0.0 (tier D); divide by 1 to stay finite
+    has_bookings = total != 0
+    safe_total = np.where(has_bookings, total, 1.0)
+    
+    # Calculate rates
+    completion_rate = completed / safe_total
+    no_show_rate = np.asarray(arrays["no_shows"], dtype=np.float64) / safe_total
+    late_rate = np.where(
+        completed > 0,
+        np.asarray(arrays["late_arrivals"], dtype=np.float64) / safe_total,
+        0.0
+    )
+    anomaly_rate = np.asarray(arrays["anomaly_count"], dtype=np.float64) / safe_total
+    
+    # Component scores (see _component_scores)
+    completion_score = np.minimum(100, (completion_rate / TARGET_COMPLETION_RATE) * 100)
+    delay_penalty = np.minimum(20, avg_delay / 3.0)
+    on_time_score = np.clip(((1.0 - late_rate) / TARGET_ON_TIME_RATE) * 100 - delay_penalty, 0, 100)
+    no_show_score = np.maximum(0, 100 - (no_show_rate / MAX_ACCEPTABLE_NO_SHOW_RATE) * 100)
+    anomaly_score = np.maximum(0, 100 - (anomaly_rate / MAX_ACCEPTABLE_ANOMALY_RATE) * 100)
+    dwell_score = np.where(
+        avg_dwell > 0,
+        np.maximum(0, 100 - (np.abs(avg_dwell - TARGET_DWELL_MINUTES) / TARGET_DWELL_MINUTES) * 100),
+        50.0
+    )
+    
+    components = np.column_stack(
+        (completion_score, on_time_score, no_show_score, anomaly_score, dwell_score)
+    )
+    components[~has_bookings] = 0.0
+    
+    scores = np.clip(components @ _WEIGHTS, 0.0, 100.0)
+    tiers = _TIER_LABELS_ARRAY[np.searchsorted(_TIER_THRESHOLDS_ARRAY, scores, side="right")]
+    
+    return {"score": scores, "tier": tiers, "components": components}
+
+
+def _rates(
+    total: int,
+    completed: int,
+    no_shows: int,
+    late_arrivals: int,
+    anomaly_count: int
+) -> Tuple[float, float, float, float]:
+    """
+    Booking rates for a carrier with total > 0.
+    
+    Returns:
+        (completion_rate, no_show_rate, late_rate, anomaly_rate)
+    """
+    return (
+        completed / total,
+        no_shows / total,
+        late_arrivals / total if completed > 0 else 0.0,
+        anomaly_count / total
+    )
+
+
+def _component_scores(
+    completion_rate: float,
+    no_show_rate: float,
+    late_rate: float,
+    anomaly_rate: float,
+    avg_delay: float,
+    avg_dwell: float,
+    # Bound at definition time (local loads instead of global/builtin
+    # lookups on every call); not meant to be passed
+    _target_completion: float = TARGET_COMPLETION_RATE,
+    _target_on_time: float = TARGET_ON_TIME_RATE,
+    _max_no_show: float = MAX_ACCEPTABLE_NO_SHOW_RATE,
+    _max_anomaly: float = MAX_ACCEPTABLE_ANOMALY_RATE,
+    _target_dwell: float = TARGET_DWELL_MINUTES,
+    _min=min,
+    _max=max
+) -> Tuple[float, float, float, float, float]:
+    """
+    Component scores (0-100 each), in _WEIGHTS order.
+    
+    Returns:
+        (completion, on_time, no_show, anomaly, dwell_efficiency)
+    """
+    # 1. Completion Rate (30%)
+    completion_score = _min(100, (completion_rate / _target_completion) * 100)
+    
+    # 2. On-Time Performance (25%)
+    # Penalize based on late arrivals and average delay
+    on_time_rate = 1.0 - late_rate
+    delay_penalty = _min(20, avg_delay / 3.0)  # Max 20 points penalty for delays
+    on_time_score = _max(0, _min(100, (on_time_rate / _target_on_time) * 100 - delay_penalty))
+    
+    # 3. No-Show Penalty (20%)
+    # Lower is better
+    no_show_score = _max(0, 100 - (no_show_rate / _max_no_show) * 100)
+    
+    # 4. Anomaly Penalty (15%)
+    # Lower is better
+    anomaly_score = _max(0, 100 - (anomaly_rate / _max_anomaly) * 100)
+    
+    # 5. Dwell Efficiency (10%)
+    # Closer to target is better
+    if avg_dwell > 0:
+        dwell_diff = abs(avg_dwell - _target_dwell)
+        dwell_score = _max(0, 100 - (dwell_diff / _target_dwell) * 100)
+    else:
+        dwell_score = 50  # Neutral if no dwell time data
+    
+    return completion_score, on_time_score, no_show_score, anomaly_score, dwell_score
+
+
+@functools.lru_cache(maxsize=2048)
+def _completion_reason(completion_rate: float) -> str:
+    """
+    Completion-rate reason for _generate_reasons (memoized).
+    
+    Rates are ratios of small booking counts, so the same value recurs
+    across carriers whose other stats differ.
+    """
+    if completion_rate >= 0.95:
+        return f"High completion rate ({completion_rate*100:.1f}%)"
+    elif completion_rate >= 0.85:
+        return f"Good completion rate ({completion_rate*100:.1f}%)"
+    return f"Low completion rate ({completion_rate*100:.1f}%) - improvement needed"
+
+
 def _generate_reasons(
     tier: str,
     completion_rate: float,
@@ -186,24 +400,12 @@ def _generate_reasons(
     total: int
 ) -> List[str]:
     """Generate 3-6 human-readable reasons for the score."""
-    reasons = []
-    
-    # Tier commentary
-    tier_messages = {
-        "A": "Excellent overall performance",
-        "B": "Good performance with room for improvement",
-        "C": "Acceptable performance but needs attention",
-        "D": "Performance needs significant improvement"
-    }
-    reasons.append(tier_messages.get(tier, "Performance assessed"))
-    
-    # Completion rate
-    if completion_rate >= 0.95:
-        reasons.append(f"High completion rate ({completion_rate*100:.1f}%)")
-    elif completion_rate >= 0.85:
-        reasons.append(f"Good completion rate ({completion_rate*100:.1f}%)")
-    else:
-        reasons.append(f"Low completion rate ({completion_rate*100:.1f}%) - improvement needed")
+    reasons = [
+        # Tier commentary
+        _TIER_MESSAGES.get(tier, "Performance assessed"),
+        # Completion rate
+        _completion_reason(completion_rate)
+    ]
     
     # No-show issues
     if no_show_rate > MAX_ACCEPTABLE_NO_SHOW_RATE:
@@ -4,12 +4,17 @@ Slot Recommendation Algorithm
 Deterministic algorithm for recommending optimal time slots based on availability,
 carrier performance, and time preferences.
 
-No external ML or randomness - purely based on rules and scoring.
+No external ML or randomness - purely based on rules and scoring. Candidate
+scores are computed for all slots at once with NumPy.
 """
 
+import math
 import logging
-from typing import Dict, Any, List, Optional, Tuple
-from datetime import datetime, timedelta
+import functools
+from typing import Dict, Any, List, Optional
+from datetime import datetime, timedelta, timezone
+
+import numpy as np
 
 logger = logging.getLogger(__name__)
 
@@ -28,6 +33,16 @@ MIN_REMAINING_CAPACITY = 1  # Must have at least 1 spot
 LOW_CARRIER_SCORE_THRESHOLD = 60  # Carriers below this need more buffer
 EARLY_BUFFER_MINUTES = 60  # Suggest slots 60min earlier for low-score carriers
 
+# Output
+MAX_RECOMMENDED_SLOTS = 5  # Slots returned with full details and reasons
+
+# Non-ISO formats still accepted by _parse_time (e.g. "2026-2-5 9:00:00")
+_LEGACY_TIME_FORMATS = ("%Y-%m-%d %H:%M:%S", "%Y-%m-%dT%H:%M:%S")
+
+# Reference points for epoch seconds (naive times are treated as UTC)
+_EPOCH = datetime(1970, 1, 1)
+_EPOCH_UTC = datetime(1970, 1, 1, tzinfo=timezone.utc)
+
 
 # ============================================================================
 # Recommendation Functions
@@ -52,7 +67,9 @@ def recommend_slots(
         preferences: Optional user preferences.
     
     Returns:
-        Dict with recommended, ranked, strategy, reasons.
+        Dict with recommended, ranked, strategy, reasons. recommended holds
+        the top slots (with rank_score and rank_reasons); ranked lists every
+        available slot best first as {slot_id, start, rank_score}.
     """
     if not candidates:
         return {
@@ -62,8 +79,8 @@ def recommend_slots(
             "reasons": ["No available slots match your criteria"]
         }
     
-    # Parse requested time
-    requested_time = _parse_time(requested.get("start"))
+    # Parse requested time (once, as epoch seconds)
+    requested_epoch = _to_epoch(requested.get("start"))
     requested_gate = requested.get("gate")
     
     # Filter: only slots with remaining capacity
@@ -85,29 +102,53 @@ def recommend_slots(
         strategy = "standard"
         prefer_earlier = False
     
-    # Score each slot
-    scored_slots = []
-    for slot in available:
-        rank_score, reasons = _score_slot(
-            slot=slot,
-            requested_time=requested_time,
-            requested_gate=requested_gate,
-            carrier_score=carrier_score,
-            prefer_earlier=prefer_earlier,
-            preferences=preferences
-        )
-        
-        scored_slots.append({
-            **slot,
-            "rank_score": round(rank_score, 2),
-            "rank_reasons": reasons
-        })
+    # Per-slot inputs as columns. Start times are parsed once into an epoch
+    # column; the offset is NaN when either time is missing.
+    n = len(available)
+    remaining = np.fromiter((s.get("remaining", 0) for s in available), dtype=np.float64, count=n)
+    capacity = np.fromiter((s.get("capacity", 1) for s in available), dtype=np.float64, count=n)
+    start_epoch = np.fromiter((_to_epoch(s.get("start")) for s in available), dtype=np.float64, count=n)
+    time_offset = (start_epoch - requested_epoch) / 60
+    gate_match = np.fromiter(
+        (bool(requested_gate) and s.get("gate") == requested_gate for s in available),
+        dtype=np.bool_,
+        count=n
+    )
+    
+    # Score all slots in one vectorized pass
+    scores = _score_slots_kernel(
+        remaining,
+        capacity,
+        time_offset,
+        gate_match,
+        prefer_earlier
+    )
     
-    # Sort by rank score (descending)
-    scored_slots.sort(key=lambda x: x["rank_score"], reverse=True)
+    # Rank on the rounded score, best first. The stable sort keeps candidate
+    # order among equal scores.
+    rank_scores = [round(score, 2) for score in scores.tolist()]
+    order = np.argsort(-np.array(rank_scores), kind="stable").tolist()
     
-    # Top 3-5 recommendations
-    recommended = scored_slots[:5]
+    # Only the top slots are copied and given reasons
+    offsets = time_offset.tolist()
+    recommended = [
+        {
+            **available[i],
+            "rank_score": rank_scores[i],
+            "rank_reasons": _slot_reasons(available[i], offsets[i], requested_gate, prefer_earlier)
+        }
+        for i in order[:MAX_RECOMMENDED_SLOTS]
+    ]
+    
+    # Full ranking, without copying every slot
+    ranked = [
+        {
+            "slot_id": available[i].get("slot_id"),
+            "start": available[i].get("start"),
+            "rank_score": rank_scores[i]
+        }
+        for i in order
+    ]
     
     # Generate overall reasons
     overall_reasons = _generate_overall_reasons(
@@ -118,35 +159,101 @@ def recommend_slots(
     
     return {
         "recommended": recommended,
-        "ranked": scored_slots,
+        "ranked": ranked,
         "strategy": strategy,
         "reasons": overall_reasons
     }
 
 
-def _score_slot(
+def _to_epoch(time_input: Any) -> float:
+    """
+    Seconds since 1970-01-01 for a time value; naive times are taken as UTC.
+    
+    Returns NaN if the value is missing or unparseable.
+    """
+    parsed = _parse_time(time_input)
+    if parsed is None:
+        return math.nan
+    return (parsed - (_EPOCH if parsed.tzinfo is None else _EPOCH_UTC)).total_seconds()
+
+
+def _score_slots_kernel(
+    remaining: np.ndarray,
+    capacity: np.ndarray,
+    time_offset: np.ndarray,
+    gate_match: np.ndarray,
+    prefer_earlier: bool
+) -> np.ndarray:
+    """
+    Score all candidate slots (0-100 each), vectorized.
+    
+    Branches of the per-slot rules become np.where selections; the weighted
+    sum is accumulated in the same order as a scalar loop would.
+    
+    Args:
+        remaining: Remaining spots per slot.
+        capacity: Capacity per slot.
+        time_offset: Signed minutes from requested time (NaN if unknown).
+        gate_match: Whether the slot is at the requested gate.
+        prefer_earlier: Low-score carrier (buffer strategy).
+    
+    Returns:
+        Array of rank scores (unrounded).
+    """
+    has_time = ~np.isnan(time_offset)
+    
+    # 1. Availability score (40%)
+    availability_ratio = np.where(capacity > 0, remaining / np.where(capacity > 0, capacity, 1.0), 0.0)
+    score = (availability_ratio * 100) * WEIGHT_AVAILABILITY
+    
+    # 2. Time distance score (30%) - closer is better (an exact match scores
+    # 100). Low-score carriers get a 50% penalty for later slots, applied as
+    # a multiplier instead of a branch. Already within 0-100, so no clamp.
+    base_time_score = np.maximum(0, 100 - np.abs(time_offset) / 3)
+    penalty = 1.0 - 0.5 * (prefer_earlier & (time_offset > 0))
+    time_score = np.where(has_time, base_time_score * penalty, 50.0)  # Neutral if no time info
+    score += time_score * WEIGHT_TIME_DISTANCE
+    
+    # 3. Carrier buffer score (20%)
+    if prefer_earlier:
+        # Low-score carriers: earlier is ideal, high capacity as fallback
+        buffer_score = np.where(
+            has_time & (time_offset < 0),
+            100.0,
+            np.where(remaining > capacity * 0.5, 80.0, 50.0)
+        )
+    else:
+        # Normal carriers: neutral
+        buffer_score = 70.0
+    score += buffer_score * WEIGHT_CARRIER_BUFFER
+    
+    # 4. Gate preference score (10%)
+    score += np.where(gate_match, 100.0, 50.0) * WEIGHT_GATE_PREFERENCE
+    
+    # Final clamp to 0-100
+    return np.clip(score, 0.0, 100.0)
+
+
+def _slot_reasons(
     slot: Dict[str, Any],
-    requested_time: Optional[datetime],
+    time_offset: float,
     requested_gate: Optional[str],
-    carrier_score: Optional[float],
-    prefer_earlier: bool,
-    preferences: Optional[Dict[str, Any]]
-) -> Tuple[float, List[str]]:
+    prefer_earlier: bool
+) -> List[str]:
     """
-    Score a single slot (0-100).
+    Human-readable reasons for a slot's rank (mirrors _score_slots_kernel).
     
-    Returns: (score, reasons)
+    Args:
+        slot: Candidate slot.
+        time_offset: Signed minutes from requested time (NaN if unknown).
+        requested_gate: Requested gate, if any.
+        prefer_earlier: Low-score carrier (buffer strategy).
     """
-    score = 0.0
     reasons = []
     
-    # 1. Availability score (40%)
+    # 1. Availability
     remaining = slot.get("remaining", 0)
     capacity = slot.get("capacity", 1)
-    availability_ratio = remaining / capacity if capacity > 0 else 0
-    availability_score = availability_ratio * 100
-    score += availability_score * WEIGHT_AVAILABILITY
-    
     if remaining > capacity * 0.5:
         reasons.append(f"High availability ({remaining}/{capacity} spots)")
     elif remaining > capacity * 0.2:
@@ -154,80 +261,37 @@ def _score_slot(
     else:
         reasons.append(f"Limited availability ({remaining}/{capacity} spots)")
     
-    # 2. Time distance score (30%)
-    slot_time = _parse_time(slot.get("start"))
-    if requested_time and slot_time:
-        # Compute absolute time difference in minutes
-        time_diff_minutes = abs((slot_time - requested_time).total_seconds() / 60)
-        
-        # Base time score - closer is better
+    # 2. Time distance
+    has_time = not math.isnan(time_offset)
+    if has_time:
+        time_diff_minutes = abs(time_offset)
         if time_diff_minutes == 0:
-            time_score = 100
             reasons.append("Exact time match")
-        else:
-            # Start with base score that decreases with distance
-            base_time_score = max(0, 100 - time_diff_minutes / 3)
-            
-            # Apply preference logic
-            if prefer_earlier and slot_time > requested_time:
-                # Penalize later slots for low-score carriers, but don't go negative
-                penalty_factor = 0.5  # 50% penalty for later slots
-                time_score = max(0, base_time_score * penalty_factor)
-                if time_diff_minutes > EARLY_BUFFER_MINUTES:
-                    reasons.append(f"Later than requested (+{int(time_diff_minutes)}min) - consider earlier")
-                else:
-                    reasons.append(f"Later by {int(time_diff_minutes)}min")
-            elif slot_time < requested_time:
-                # Earlier slots - good for buffer
-                time_score = base_time_score
-                if time_diff_minutes <= EARLY_BUFFER_MINUTES:
-                    reasons.append(f"Earlier by {int(time_diff_minutes)}min - good buffer")
-                else:
-                    reasons.append(f"Earlier by {int(time_diff_minutes)}min")
+        elif prefer_earlier and time_offset > 0:
+            if time_diff_minutes > EARLY_BUFFER_MINUTES:
+                reasons.append(f"Later than requested (+{int(time_diff_minutes)}min) - consider earlier")
             else:
-                # Same time or later (normal case)
-                time_score = base_time_score
-                if time_diff_minutes <= 30:
-                    reasons.append(f"Close to requested time (+/-{int(time_diff_minutes)}min)")
-                else:
-                    reasons.append(f"Time difference: {int(time_diff_minutes)}min")
-        
-        # Clamp time_score to 0-100
-        time_score = max(0, min(100, time_score))
-        score += time_score * WEIGHT_TIME_DISTANCE
-    else:
-        # No time info, neutral score
-        score += 50 * WEIGHT_TIME_DISTANCE
-    
-    # 3. Carrier buffer score (20%)
-    if carrier_score is not None and carrier_score < LOW_CARRIER_SCORE_THRESHOLD:
-        # Low-score carriers: prefer slots with more buffer
-        if slot_time and requested_time and slot_time < requested_time:
-            buffer_score = 100  # Earlier is ideal
-            reasons.append("Early slot recommended for reliability buffer")
-        elif remaining > capacity * 0.5:
-            buffer_score = 80  # High capacity as fallback
+                reasons.append(f"Later by {int(time_diff_minutes)}min")
+        elif time_offset < 0:
+            # Earlier slots - good for buffer
+            if time_diff_minutes <= EARLY_BUFFER_MINUTES:
+                reasons.append(f"Earlier by {int(time_diff_minutes)}min - good buffer")
+            else:
+                reasons.append(f"Earlier by {int(time_diff_minutes)}min")
+        elif time_diff_minutes <= 30:
+            reasons.append(f"Close to requested time (+/-{int(time_diff_minutes)}min)")
         else:
-            buffer_score = 50
-        
-        score += buffer_score * WEIGHT_CARRIER_BUFFER
-    else:
-        # Normal carriers: neutral
-        score += 70 * WEIGHT_CARRIER_BUFFER
+            reasons.append(f"Time difference: {int(time_diff_minutes)}min")
     
-    # 4. Gate preference score (10%)
+    # 3. Carrier buffer
+    if prefer_earlier and has_time and time_offset < 0:
+        reasons.append("Early slot recommended for reliability buffer")
+    
+    # 4. Gate preference
     if requested_gate and slot.get("gate") == requested_gate:
-        gate_score = 100
         reasons.append(f"Matches requested gate {requested_gate}")
-    else:
-        gate_score = 50  # Neutral if no preference or different gate
-    
-    score += gate_score * WEIGHT_GATE_PREFERENCE
     
-    # Final clamp to 0-100
-    score = max(0.0, min(100.0, score))
-    
-    return score, reasons
+    return reasons
 
 
 def _parse_time(time_input: Any) -> Optional[datetime]:
@@ -236,16 +300,39 @@ def _parse_time(time_input: Any) -> Optional[datetime]:
         return time_input
     
     if isinstance(time_input, str):
+        return _parse_time_str(time_input)
+    
+    return None
+
+
+@functools.lru_cache(maxsize=4096)
+def _parse_time_str(time_input: str) -> Optional[datetime]:
+    """
+    Parse a time string: ISO 8601 (optional "Z" suffix), "HH:MM", or a
+    legacy non-zero-padded "Y-m-d H:M:S" format.
+    
+    Cached: slot start times repeat across requests and datetimes are
+    immutable, so sharing the parsed value is safe.
+    """
+    # "HH:MM"
+    if len(time_input) == 5 and time_input[2] == ":":
+        try:
+            return datetime.strptime(time_input, "%H:%M")
+        except ValueError:
+            return None
+    
+    # ISO format (the common case)
+    try:
+        return datetime.fromisoformat(time_input.replace("Z", "+00:00"))
+    except ValueError:
+        pass
+    
+    # Legacy formats strptime accepts without zero padding
+    for fmt in _LEGACY_TIME_FORMATS:
         try:
-            # Try ISO format
-            return datetime.fromisoformat(time_input.replace("Z", "+00:00"))
-        except Exception:
-            try:
-                # Try common formats
-                for fmt in ["%Y-%m-%d %H:%M:%S", "%H:%M", "%Y-%m-%dT%H:%M:%S"]:
-                    return datetime.strptime(time_input, fmt)
-            except Exception:
-                pass
+            return datetime.strptime(time_input, fmt)
+        except ValueError:
+            continue
     
     return None
 
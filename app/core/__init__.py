@@ -9,6 +9,7 @@ Modules:
 - logging: Structured logging with trace_id support
 - errors: Standardized error classes and HTTP conversion
 - security: Authentication and authorization helpers
+- circuit_breaker: Fail-fast circuit breaker for downstream service calls
 
 Usage:
     from app.core import settings, setup_logging, set_trace_id
@@ -41,6 +42,9 @@ from app.core.errors import (
     to_http_exception
 )
 
+# Circuit breaker
+from app.core.circuit_breaker import CircuitBreaker, CircuitOpenError
+
 # Security
 from app.core.security import (
     require_auth,
@@ -77,6 +81,10 @@ __all__ = [
     "from_http_exception",
     "to_http_exception",
     
+    # Circuit breaker
+    "CircuitBreaker",
+    "CircuitOpenError",
+    
     # Security
     "require_auth",
     "require_role",
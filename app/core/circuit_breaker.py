@@ -0,0 +1,125 @@
+"""
+Core Circuit Breaker Module
+
+Minimal async circuit breaker for calls to downstream services, so requests
+fail fast while a backend is known to be down instead of waiting for a
+timeout every time.
+
+States:
+- closed: calls go through; consecutive failures are counted
+- open: after failure_threshold consecutive failures, calls are rejected with
+  CircuitOpenError until recovery_timeout seconds have passed
+- half_open: after the timeout one trial call is let through; success closes
+  the circuit, failure re-opens it
+
+Usage:
+    from app.core.circuit_breaker import CircuitBreaker, CircuitOpenError
+
+    breaker = CircuitBreaker("carrier_service", is_failure=lambda e: ...)
+
+    try:
+        async with breaker:
+            stats = await get_carrier_stats(...)
+    except CircuitOpenError:
+        ...  # fallback
+"""
+
+import time
+import asyncio
+import logging
+from typing import Callable, Optional
+
+logger = logging.getLogger(__name__)
+
+
+class CircuitOpenError(Exception):
+    """
+    Raised when a call is rejected because the circuit is open.
+
+    Attributes:
+        name: Name of the breaker (downstream service)
+        retry_after: Seconds until a trial call will be allowed
+    """
+
+    def __init__(self, name: str, retry_after: float):
+        self.name = name
+        self.retry_after = retry_after
+        super().__init__(f"Circuit '{name}' is open (retry in {retry_after:.1f}s)")
+
+
+class CircuitBreaker:
+    """
+    Async context manager implementing a consecutive-failure circuit breaker.
+
+    Only exceptions for which is_failure(exc) is true count as failures
+    (e.g. timeouts and 5xx); any other outcome means the service answered
+    and resets the failure count. Cancellation is neither.
+    """
+
+    __slots__ = (
+        "name", "failure_threshold", "recovery_timeout", "is_failure",
+        "_failures", "_opened_at", "_trial_in_progress"
+    )
+
+    def __init__(
+        self,
+        name: str,
+        failure_threshold: int = 5,
+        recovery_timeout: float = 10.0,
+        is_failure: Optional[Callable[[BaseException], bool]] = None
+    ):
+        self.name = name
+        self.failure_threshold = failure_threshold
+        self.recovery_timeout = recovery_timeout
+        self.is_failure = is_failure or (lambda e: True)
+        self._failures = 0
+        self._opened_at: Optional[float] = None
+        self._trial_in_progress = False
+
+    @property
+    def state(self) -> str:
+        """Current state: "closed", "open" or "half_open"."""
+        if self._opened_at is None:
+            return "closed"
+        if self._trial_in_progress or time.monotonic() - self._opened_at >= self.recovery_timeout:
+            return "half_open"
+        return "open"
+
+    def reset(self) -> None:
+        """Close the circuit and clear the failure count. Useful for testing."""
+        self._failures = 0
+        self._opened_at = None
+        self._trial_in_progress = False
+
+    async def __aenter__(self) -> "CircuitBreaker":
+        if self._opened_at is not None:
+            elapsed = time.monotonic() - self._opened_at
+            if elapsed < self.recovery_timeout or self._trial_in_progress:
+                raise CircuitOpenError(self.name, max(0.0, self.recovery_timeout - elapsed))
+            # Half-open: let exactly one trial call through
+            self._trial_in_progress = True
+        return self
+
+    async def __aexit__(self, exc_type, exc, tb) -> bool:
+        trial = self._trial_in_progress
+        self._trial_in_progress = False
+
+        if exc is not None and isinstance(exc, asyncio.CancelledError):
+            return False
+
+        if exc is None or not self.is_failure(exc):
+            if self._opened_at is not None:
+                logger.info("Circuit '%s' closed", self.name)
+            self._failures = 0
+            self._opened_at = None
+            return False
+
+        self._failures += 1
+        if trial or self._failures >= self.failure_threshold:
+            if self._opened_at is None or trial:
+                logger.warning(
+                    "Circuit '%s' opened after %d failure(s): %s",
+                    self.name, self._failures, type(exc).__name__
+                )
+            self._opened_at = time.monotonic()
+        return False
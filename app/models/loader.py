@@ -21,9 +21,10 @@ Usage:
 """
 
 import os
+import asyncio
 import logging
 from time import perf_counter
-from typing import Dict, Any, Optional, List
+from typing import Dict, Any, Optional, List, Callable
 from datetime import datetime
 from abc import ABC, abstractmethod
 
@@ -472,6 +473,13 @@ class SlotRecommendationModel(BaseModel):
             from app.algorithms.slot_recommender import recommend_slots
             from fastapi import HTTPException
             
+            # Get carrier score (if carrier_id provided) while availability is fetched
+            carrier_task = None
+            if carrier_id:
+                carrier_task = asyncio.ensure_future(
+                    self._get_carrier_score(carrier_id, context, trace_id)
+                )
+            
             try:
                 # Fetch availability
                 slots = await get_availability(
@@ -482,19 +490,7 @@ class SlotRecommendationModel(BaseModel):
                     request_id=trace_id[:8]
                 )
                 
-                # Get carrier score if carrier_id provided
-                carrier_score = None
-                if carrier_id:
-                    try:
-                        carrier_model = get_model("carrier_scoring")
-                        carrier_result = await carrier_model.predict(
-                            input={"carrier_id": carrier_id},
-                            context=context
-                        )
-                        if carrier_result.get("ok"):
-                            carrier_score = carrier_result["result"].get("score")
-                    except Exception as e:
-                        logger.warning(f"[{trace_id[:8]}] Could not get carrier score: {type(e).__name__}")
+                carrier_score = await carrier_task if carrier_task is not None else None
                 
                 # Run recommender
                 requested = {
@@ -509,18 +505,22 @@ class SlotRecommendationModel(BaseModel):
                     carrier_score=carrier_score
                 )
                 
+                result = {
+                    "terminal": terminal,
+                    "date": date_str,
+                    "recommended": reco_result["recommended"],
+                    "strategy": reco_result["strategy"],
+                    "reasons": reco_result["reasons"],
+                    "total_candidates": len(slots)
+                }
+                if carrier_score is not None:
+                    result["carrier_context"] = {"score": carrier_score}
+                
                 latency_ms = (perf_counter() - start_time) * 1000
                 
                 return {
                     "ok": True,
-                    "result": {
-                        "terminal": terminal,
-                        "date": date_str,
-                        "recommended": reco_result["recommended"],
-                        "strategy": reco_result["strategy"],
-                        "reasons": reco_result["reasons"],
-                        "total_candidates": len(slots)
-                    },
+                    "result": result,
                     "proofs": {
                         "trace_id": trace_id,
                         "model": self.name,
@@ -543,6 +543,11 @@ class SlotRecommendationModel(BaseModel):
                         perf_counter() - start_time,
                         error_type="ServiceError"
                     )
+            
+            finally:
+                # Availability failed: the carrier score is no longer needed
+                if carrier_task is not None and not carrier_task.done():
+                    carrier_task.cancel()
                     
         except Exception as e:
             logger.exception(f"[{trace_id[:8]}] SlotRecommendationModel error: {e}")
@@ -552,6 +557,25 @@ class SlotRecommendationModel(BaseModel):
                 perf_counter() - start_time
             )
     
+    async def _get_carrier_score(
+        self,
+        carrier_id: str,
+        context: Dict[str, Any],
+        trace_id: str
+    ) -> Optional[float]:
+        """Look up the carrier score via the carrier_scoring model (None if unavailable)."""
+        try:
+            carrier_model = get_model("carrier_scoring")
+            carrier_result = await carrier_model.predict(
+                input={"carrier_id": carrier_id},
+                context=context
+            )
+            if carrier_result.get("ok"):
+                return carrier_result["result"].get("score")
+        except Exception as e:
+            logger.warning(f"[{trace_id[:8]}] Could not get carrier score: {type(e).__name__}")
+        return None
+    
     def _mvp_fallback(self, input: Dict[str, Any], trace_id: str, start_time: float) -> Dict[str, Any]:
         """MVP mode: rank provided candidates or return error."""
         candidates = input.get("candidates")
@@ -793,6 +817,9 @@ class ModelRegistry:
             "traffic_model": {"path": _artifact_path("traffic_model"), "type": "joblib"},
             "anomaly_model": {"path": _artifact_path("anomaly_model"), "type": "joblib"},
         }
+        
+        # Called with a model name after its instance is reloaded or closed
+        self._reload_listeners: List[Callable[[str], None]] = []
     
     def get_model(self, name: str) -> BaseModel:
         """
@@ -822,7 +849,6 @@ class ModelRegistry:
         # Optional warmup
         if ENABLE_MODEL_WARMUP:
             try:
-                import asyncio
                 asyncio.create_task(model.warmup())
             except Exception as e:
                 logger.warning(f"Model warmup failed for {name}: {e}")
@@ -878,9 +904,27 @@ class ModelRegistry:
                 logger.warning(f"Error closing model {name}: {e}")
             
             del self._models[name]
+            self._notify_reload(name)
         
         return self.get_model(name)
     
+    def add_reload_listener(self, listener: Callable[[str], None]) -> None:
+        """
+        Register a callback run with the model name whenever reload_model()
+        or close_all() replaces or closes that model's instance.
+        
+        Lets callers that cache a model instance invalidate it.
+        """
+        self._reload_listeners.append(listener)
+    
+    def _notify_reload(self, name: str) -> None:
+        """Run reload listeners for a model (errors are logged, not raised)."""
+        for listener in self._reload_listeners:
+            try:
+                listener(name)
+            except Exception as e:
+                logger.warning(f"Reload listener failed for {name}: {e}")
+    
     def healthcheck(self) -> Dict[str, Any]:
         """
         Get health status of all loaded models.
@@ -920,7 +964,10 @@ class ModelRegistry:
             except Exception as e:
                 logger.error(f"Error closing model {name}: {e}")
         
+        closed = list(self._models)
         self._models.clear()
+        for name in closed:
+            self._notify_reload(name)
 
 
 # ============================================================================
@@ -952,6 +999,11 @@ def reload_model(name: str) -> BaseModel:
     return _registry.reload_model(name)
 
 
+def add_reload_listener(listener: Callable[[str], None]) -> None:
+    """Register a callback run with the model name after a reload or close."""
+    _registry.add_reload_listener(listener)
+
+
 def models_health() -> Dict[str, Any]:
     """Get health status of all models."""
     return _registry.healthcheck()
@@ -70,6 +70,20 @@ def mock_slot_availability():
     ]
 
 
+@pytest.fixture
+def booking_cache(monkeypatch):
+    """Empty booking status cache with a controllable monotonic clock."""
+    from types import SimpleNamespace
+    import app.agents.booking_agent as booking_module
+    
+    now = [1000.0]
+    monkeypatch.setattr(booking_module, "time", SimpleNamespace(monotonic=lambda: now[0]))
+    monkeypatch.setattr(booking_module, "BOOKING_CACHE_TTL", 15.0)
+    booking_module.clear_booking_cache()
+    yield now
+    booking_module.clear_booking_cache()
+
+
 # ==================== BookingAgent Tests ====================
 
 @pytest.mark.asyncio
@@ -152,6 +166,157 @@ async def test_booking_agent_missing_auth(context_base):
     assert "error" in data or "error_type" in data
 
 
+@pytest.mark.asyncio
+async def test_booking_agent_fanout_proofs_list_called_endpoints(monkeypatch):
+    """Test multi-ref fan-out proofs name each concrete status endpoint that was called."""
+    import app.agents.booking_agent as booking_module
+    from app.agents.booking_agent import BookingAgent, BookingQuery
+    
+    async def mock_get_booking_status(booking_ref, auth_header=None, request_id=None):
+        return {
+            "booking_ref": booking_ref,
+            "status": "CONFIRMED",
+            "terminal": "A",
+            "gate": "G1",
+            "slot_time": "2026-02-05T09:00:00Z",
+            "last_update": "2026-02-04T10:00:00Z"
+        }
+    
+    monkeypatch.setattr(booking_module, "get_booking_status", mock_get_booking_status)
+    monkeypatch.setattr(booking_module, "BOOKING_STATUS_PATH", "/bookings/{booking_ref}")
+    
+    query = BookingQuery("Bearer test_token", None, None, "trace123456", "trace123", "OPERATOR")
+    result = await BookingAgent()._handle_multiple_bookings(["BK-1", "BK-2"], query)
+    
+    endpoints = [source["endpoint"] for source in result["proofs"]["sources"]]
+    assert endpoints == ["/bookings/BK-1", "/bookings/BK-2"]
+
+
+@pytest.mark.asyncio
+async def test_booking_cache_entry_expires(booking_cache, monkeypatch):
+    """Test cached booking statuses are served until the TTL passes, then refetched."""
+    import app.agents.booking_agent as booking_module
+    
+    calls = []
+    
+    async def mock_get_booking_status(booking_ref, auth_header=None, request_id=None):
+        calls.append(booking_ref)
+        return {"booking_ref": booking_ref, "status": f"status-{len(calls)}"}
+    
+    monkeypatch.setattr(booking_module, "get_booking_status", mock_get_booking_status)
+    
+    data, cache_hit = await booking_module._get_booking_status_cached("BK-1", "Bearer a", "req1")
+    assert (data["status"], cache_hit) == ("status-1", False)
+    
+    booking_cache[0] += 14.9
+    data, cache_hit = await booking_module._get_booking_status_cached("BK-1", "Bearer a", "req1")
+    assert (data["status"], cache_hit) == ("status-1", True)
+    
+    booking_cache[0] += 0.1
+    data, cache_hit = await booking_module._get_booking_status_cached("BK-1", "Bearer a", "req1")
+    assert (data["status"], cache_hit) == ("status-2", False)
+    assert calls == ["BK-1", "BK-1"]
+
+
+@pytest.mark.asyncio
+async def test_booking_cache_separated_per_auth_header(booking_cache, monkeypatch):
+    """Test one user's cached booking is never served to another auth header."""
+    import app.agents.booking_agent as booking_module
+    
+    calls = []
+    
+    async def mock_get_booking_status(booking_ref, auth_header=None, request_id=None):
+        calls.append(auth_header)
+        return {"booking_ref": booking_ref, "owner": auth_header}
+    
+    monkeypatch.setattr(booking_module, "get_booking_status", mock_get_booking_status)
+    
+    data_a, hit_a = await booking_module._get_booking_status_cached("BK-1", "Bearer user_a", "req1")
+    data_b, hit_b = await booking_module._get_booking_status_cached("BK-1", "Bearer user_b", "req2")
+    
+    assert (data_a["owner"], hit_a) == ("Bearer user_a", False)
+    assert (data_b["owner"], hit_b) == ("Bearer user_b", False)
+    assert calls == ["Bearer user_a", "Bearer user_b"]
+    
+    # Each header now hits only its own entry
+    data_a, hit_a = await booking_module._get_booking_status_cached("BK-1", "Bearer user_a", "req3")
+    data_b, hit_b = await booking_module._get_booking_status_cached("BK-1", "Bearer user_b", "req4")
+    assert (data_a["owner"], hit_a) == ("Bearer user_a", True)
+    assert (data_b["owner"], hit_b) == ("Bearer user_b", True)
+    assert len(calls) == 2
+
+
+@pytest.mark.asyncio
+async def test_booking_cache_coalesces_concurrent_lookups(booking_cache, monkeypatch):
+    """Test concurrent misses for the same booking and auth header share one backend call."""
+    import asyncio
+    import app.agents.booking_agent as booking_module
+    
+    calls = []
+    
+    async def mock_get_booking_status(booking_ref, auth_header=None, request_id=None):
+        calls.append((booking_ref, auth_header))
+        await asyncio.sleep(0.01)
+        return {"booking_ref": booking_ref, "owner": auth_header}
+    
+    monkeypatch.setattr(booking_module, "get_booking_status", mock_get_booking_status)
+    
+    results = await asyncio.gather(
+        *(booking_module._get_booking_status_cached("BK-1", "Bearer a", f"req{i}") for i in range(5)),
+        booking_module._get_booking_status_cached("BK-1", "Bearer b", "req5")
+    )
+    
+    assert sorted(calls) == [("BK-1", "Bearer a"), ("BK-1", "Bearer b")]
+    assert [hit for _, hit in results[:5]].count(False) == 1
+    assert all(data["owner"] == "Bearer a" for data, _ in results[:5])
+    assert results[5] == ({"booking_ref": "BK-1", "owner": "Bearer b"}, False)
+    assert booking_module._booking_locks == {}
+
+
+@pytest.mark.asyncio
+async def test_booking_cache_coalesces_lookups_after_fetch_error(booking_cache, monkeypatch):
+    """Test a failed fetch hands over to queued lookups without letting a new caller run alongside."""
+    import asyncio
+    from fastapi import HTTPException
+    import app.agents.booking_agent as booking_module
+    
+    calls = []
+    active = [0, 0]  # [running, max running]
+    late = []
+    
+    async def mock_get_booking_status(booking_ref, auth_header=None, request_id=None):
+        calls.append(request_id)
+        active[0] += 1
+        active[1] = max(active)
+        try:
+            await asyncio.sleep(0.01)
+            if len(calls) == 1:
+                # Arrives while the failing call releases the lock to a queued waiter
+                late.append(asyncio.ensure_future(
+                    booking_module._get_booking_status_cached("BK-1", "Bearer a", "late")
+                ))
+                raise HTTPException(status_code=503, detail="unavailable")
+            return {"booking_ref": booking_ref, "fetched_by": request_id}
+        finally:
+            active[0] -= 1
+    
+    monkeypatch.setattr(booking_module, "get_booking_status", mock_get_booking_status)
+    
+    results = await asyncio.gather(
+        *(booking_module._get_booking_status_cached("BK-1", "Bearer a", f"req{i}") for i in range(3)),
+        return_exceptions=True
+    )
+    late_data, late_hit = await late[0]
+    
+    assert isinstance(results[0], HTTPException)
+    assert calls == ["req0", "req1"]
+    assert active[1] == 1
+    assert results[1] == ({"booking_ref": "BK-1", "fetched_by": "req1"}, False)
+    assert results[2] == ({"booking_ref": "BK-1", "fetched_by": "req1"}, True)
+    assert (late_data["fetched_by"], late_hit) == ("req1", True)
+    assert booking_module._booking_locks == {}
+
+
 # ==================== CarrierScoreAgent Tests ====================
 
 @pytest.mark.asyncio
@@ -254,6 +419,169 @@ async def test_carrier_score_agent_mvp_fallback(context_base, monkeypatch):
         assert result["proofs"]["data_quality"] in ["mvp", "fallback"]
 
 
+@pytest.mark.asyncio
+async def test_carrier_score_agent_speculative_fallback_error_retrieved(context_base, mock_carrier_stats, monkeypatch):
+    """Test a failed speculative booking fetch is not reported as never retrieved."""
+    import asyncio
+    import gc
+    import app.agents.carrier_score_agent as carrier_module
+    
+    async def mock_stats_cached(carrier_id, window_days, auth_header, request_id):
+        await asyncio.sleep(0.01)  # Let the speculative fetch fail first
+        return mock_carrier_stats
+    
+    async def mock_request_bookings_404(self, carrier_id, auth_header):
+        raise RuntimeError("bookings endpoint returned 404")
+    
+    monkeypatch.setattr(carrier_module, "SPECULATIVE_FALLBACK", True)
+    monkeypatch.setattr(carrier_module, "_get_carrier_stats_cached", mock_stats_cached)
+    monkeypatch.setattr(carrier_module.CarrierScoreAgent, "_request_carrier_bookings", mock_request_bookings_404)
+    carrier_module.clear_stats_cache()
+    
+    loop = asyncio.get_running_loop()
+    unhandled = []
+    loop.set_exception_handler(lambda _loop, ctx: unhandled.append(ctx))
+    try:
+        context = {**context_base, "entities": {"carrier_id": "carrier-spec"}}
+        result = await carrier_module.CarrierScoreAgent().execute(context)
+        await asyncio.sleep(0)
+        gc.collect()
+    finally:
+        loop.set_exception_handler(None)
+    
+    # REAL stats answered; the failed speculative task was consumed silently
+    assert result["data"]["carrier_id"] == "carrier-spec"
+    assert unhandled == []
+
+
+def test_carrier_cached_response_isolated_between_requests(mock_carrier_stats):
+    """Test modifying one cached-stats response does not leak into later cache hits."""
+    import copy
+    import app.agents.carrier_score_agent as carrier_module
+    from app.agents.carrier_score_agent import CarrierScoreAgent
+    
+    agent = CarrierScoreAgent()
+    carrier_module.clear_stats_cache()
+    
+    try:
+        first = agent._cached_success_response("123", mock_carrier_stats, "trace-a", "trace-a", "OPERATOR")
+        expected = copy.deepcopy(first)
+        
+        first["data"]["score"] = -1
+        first["data"]["error"] = "changed"
+        first["data"]["stats"].clear()
+        first["data"]["components"].clear()
+        first["data"]["reasons"].append("changed")
+        first["proofs"]["sources"][0]["status"] = "changed"
+        first["proofs"]["sources"].append({})
+        
+        later = agent._cached_success_response("123", mock_carrier_stats, "trace-b", "trace-b", "OPERATOR")
+        assert later["message"] == expected["message"]
+        assert later["data"] == expected["data"]
+        assert later["proofs"]["sources"] == expected["proofs"]["sources"]
+        assert later["proofs"]["trace_id"] == "trace-b"
+    finally:
+        carrier_module.clear_stats_cache()
+
+
+@pytest.mark.asyncio
+async def test_carrier_coalesced_call_survives_one_cancelled_waiter():
+    """Test a shared in-flight call keeps running while another caller still waits."""
+    import asyncio
+    from app.agents.carrier_score_agent import _coalesced
+    
+    inflight = {}
+    calls = []
+    
+    async def fetch():
+        calls.append(1)
+        await asyncio.sleep(0.01)
+        return "stats"
+    
+    first = asyncio.ensure_future(_coalesced(inflight, ("c1", 30, "h"), fetch))
+    second = asyncio.ensure_future(_coalesced(inflight, ("c1", 30, "h"), fetch))
+    await asyncio.sleep(0)
+    
+    first.cancel()
+    assert await second == "stats"
+    assert first.cancelled()
+    assert len(calls) == 1
+    assert inflight == {}
+
+
+@pytest.mark.asyncio
+async def test_carrier_coalesced_call_cancelled_with_last_waiter():
+    """Test the shared call is cancelled once no caller is waiting for it."""
+    import asyncio
+    from app.agents.carrier_score_agent import _coalesced
+    
+    inflight = {}
+    finished = []
+    
+    async def fetch():
+        await asyncio.sleep(0.01)
+        finished.append(1)
+        return "bookings"
+    
+    waiter = asyncio.ensure_future(_coalesced(inflight, ("c1", 30, "h"), fetch))
+    await asyncio.sleep(0)
+    shared_task = inflight[("c1", 30, "h")].task
+    
+    waiter.cancel()
+    await asyncio.sleep(0.02)
+    
+    assert shared_task.cancelled()
+    assert finished == []
+    assert inflight == {}
+    
+    # The key is free again: a new caller starts a fresh call
+    assert await _coalesced(inflight, ("c1", 30, "h"), fetch) == "bookings"
+
+
+# ==================== AnomalyAgent Tests ====================
+
+def test_anomaly_model_cache_invalidated_on_reload(monkeypatch):
+    """Test AnomalyAgent drops its cached model instance when the registry reloads it."""
+    import app.models.loader as loader
+    from app.agents.anomaly_agent import _get_anomaly_model
+    
+    class FakeAnomalyModel(loader.BaseModel):
+        name = "anomaly_model"
+        version = "test"
+        
+        def __init__(self, mode: str = "real"):
+            self.mode = mode
+            self.closed = False
+        
+        async def predict(self, input, context):
+            return {"ok": False}
+        
+        def close(self):
+            self.closed = True
+    
+    monkeypatch.setitem(loader._registry._model_classes, "anomaly_model", FakeAnomalyModel)
+    monkeypatch.delitem(loader._registry._artifact_metadata, "anomaly_model")
+    monkeypatch.delitem(loader._registry._models, "anomaly_model", raising=False)
+    _get_anomaly_model.cache_clear()
+    
+    try:
+        first = _get_anomaly_model()
+        assert isinstance(first, FakeAnomalyModel)
+        assert _get_anomaly_model() is first
+        
+        reloaded = loader.reload_model("anomaly_model")
+        assert first.closed
+        assert _get_anomaly_model() is reloaded
+        assert reloaded is not first
+        
+        loader.close_all_models()
+        assert reloaded.closed
+        assert _get_anomaly_model() is not reloaded
+    finally:
+        loader._registry._models.pop("anomaly_model", None)
+        _get_anomaly_model.cache_clear()
+
+
 # ==================== SlotAgent Tests ====================
 
 @pytest.mark.asyncio
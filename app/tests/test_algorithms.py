@@ -313,6 +313,137 @@ def test_slot_recommender_deterministic():
     assert ids1 == ids2
 
 
+def _reference_slot_score(remaining, capacity, time_offset, gate_match, prefer_earlier):
+    """Per-slot scalar scoring as it was before the vectorized kernel (score only)."""
+    from app.algorithms.slot_recommender import (
+        WEIGHT_AVAILABILITY,
+        WEIGHT_TIME_DISTANCE,
+        WEIGHT_CARRIER_BUFFER,
+        WEIGHT_GATE_PREFERENCE
+    )
+    
+    score = 0.0
+    
+    availability_ratio = remaining / capacity if capacity > 0 else 0
+    score += availability_ratio * 100 * WEIGHT_AVAILABILITY
+    
+    if time_offset is not None:
+        time_diff_minutes = abs(time_offset)
+        if time_diff_minutes == 0:
+            time_score = 100
+        elif prefer_earlier and time_offset > 0:
+            time_score = max(0, max(0, 100 - time_diff_minutes / 3) * 0.5)
+        else:
+            time_score = max(0, 100 - time_diff_minutes / 3)
+        score += max(0, min(100, time_score)) * WEIGHT_TIME_DISTANCE
+    else:
+        score += 50 * WEIGHT_TIME_DISTANCE
+    
+    if prefer_earlier:
+        if time_offset is not None and time_offset < 0:
+            buffer_score = 100
+        elif remaining > capacity * 0.5:
+            buffer_score = 80
+        else:
+            buffer_score = 50
+        score += buffer_score * WEIGHT_CARRIER_BUFFER
+    else:
+        score += 70 * WEIGHT_CARRIER_BUFFER
+    
+    score += (100 if gate_match else 50) * WEIGHT_GATE_PREFERENCE
+    
+    return max(0.0, min(100.0, score))
+
+
+def test_slot_recommender_kernel_matches_scalar_scoring():
+    """Test the vectorized kernel scores every slot like the per-slot scalar rules."""
+    import itertools
+    import numpy as np
+    from app.algorithms.slot_recommender import _score_slots_kernel
+    
+    cases = list(itertools.product(
+        [(1, 10), (5, 10), (6, 10), (2, 10), (3, 3), (4, 0)],  # (remaining, capacity)
+        [None, -400.0, -60.0, -1.5, 0.0, 0.5, 30.0, 61.0, 299.0, 301.0, 1000.0],  # minutes
+        [False, True]  # gate match
+    ))
+    
+    for prefer_earlier in (False, True):
+        scores = _score_slots_kernel(
+            np.array([c[0][0] for c in cases], dtype=np.float64),
+            np.array([c[0][1] for c in cases], dtype=np.float64),
+            np.array([np.nan if c[1] is None else c[1] for c in cases], dtype=np.float64),
+            np.array([c[2] for c in cases], dtype=np.bool_),
+            prefer_earlier
+        )
+        
+        for (slot_capacity, time_offset, gate_match), score in zip(cases, scores.tolist()):
+            expected = _reference_slot_score(
+                slot_capacity[0], slot_capacity[1], time_offset, gate_match, prefer_earlier
+            )
+            assert score == pytest.approx(expected, abs=1e-9), (slot_capacity, time_offset, gate_match)
+
+
+def test_slot_recommender_ranking_matches_scalar_order():
+    """Test ranking order matches a stable sort of scalar scores, ties kept in candidate order."""
+    from app.algorithms.slot_recommender import recommend_slots
+    
+    base_time = datetime(2026, 2, 5, 9, 0, 0)
+    
+    # (offset minutes, remaining, capacity, gate); several slots tie exactly
+    layout = [
+        (0, 5, 10, "G1"),
+        (90, 8, 10, "G2"),
+        (-30, 5, 10, "G1"),
+        (0, 5, 10, "G1"),
+        (90, 8, 10, "G2"),
+        (-120, 1, 10, "G3"),
+        (600, 10, 10, "G1"),
+        (-30, 5, 10, "G1"),
+        (45, 0, 10, "G1"),  # Fully booked, filtered out
+    ]
+    candidates = [
+        {
+            "slot_id": f"slot-{i:03d}",
+            "start": (base_time + timedelta(minutes=offset)).isoformat() + "Z",
+            "end": (base_time + timedelta(minutes=offset + 60)).isoformat() + "Z",
+            "capacity": capacity,
+            "remaining": remaining,
+            "terminal": "A",
+            "gate": gate
+        }
+        for i, (offset, remaining, capacity, gate) in enumerate(layout)
+    ]
+    requested = {
+        "start": base_time.isoformat() + "Z",
+        "terminal": "A",
+        "gate": "G1"
+    }
+    
+    for carrier_score in (None, 40.0):
+        prefer_earlier = carrier_score is not None
+        
+        # Old ranking: rounded scalar scores, stable descending sort
+        expected = [
+            (f"slot-{i:03d}", round(_reference_slot_score(
+                remaining, capacity, float(offset), gate == "G1", prefer_earlier
+            ), 2))
+            for i, (offset, remaining, capacity, gate) in enumerate(layout)
+            if remaining >= 1
+        ]
+        expected.sort(key=lambda item: item[1], reverse=True)
+        
+        result = recommend_slots(requested, candidates, carrier_score=carrier_score)
+        
+        assert [(s["slot_id"], s["rank_score"]) for s in result["ranked"]] == expected
+        assert [s["slot_id"] for s in result["recommended"]] == [slot_id for slot_id, _ in expected[:5]]
+        
+        # Exact ties keep candidate order
+        ranked_ids = [s["slot_id"] for s in result["ranked"]]
+        assert ranked_ids.index("slot-000") < ranked_ids.index("slot-003")
+        assert ranked_ids.index("slot-001") < ranked_ids.index("slot-004")
+        assert ranked_ids.index("slot-002") < ranked_ids.index("slot-007")
+
+
 # ==================== Run Tests ====================
 
 if __name__ == "__main__":
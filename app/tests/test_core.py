@@ -0,0 +1,138 @@
+"""
+Core Tests
+
+Tests for core infrastructure:
+- circuit_breaker.CircuitBreaker
+
+Run: pytest tests/test_core.py -v
+"""
+
+import pytest
+from types import SimpleNamespace
+
+
+# ==================== Fixtures ====================
+
+@pytest.fixture
+def clock(monkeypatch):
+    """Controllable monotonic clock for the circuit breaker module."""
+    from app.core import circuit_breaker
+    
+    now = [1000.0]
+    monkeypatch.setattr(circuit_breaker, "time", SimpleNamespace(monotonic=lambda: now[0]))
+    return now
+
+
+async def _fail(breaker, exc=None):
+    """Run one failing call through the breaker."""
+    with pytest.raises(type(exc) if exc else RuntimeError):
+        async with breaker:
+            raise exc or RuntimeError("backend down")
+
+
+async def _succeed(breaker):
+    """Run one successful call through the breaker."""
+    async with breaker:
+        pass
+
+
+# ==================== Circuit Breaker Tests ====================
+
+@pytest.mark.asyncio
+async def test_circuit_breaker_trips_after_threshold(clock):
+    """Test circuit opens after failure_threshold consecutive failures."""
+    from app.core.circuit_breaker import CircuitBreaker
+    
+    breaker = CircuitBreaker("svc", failure_threshold=3, recovery_timeout=10.0)
+    
+    await _fail(breaker)
+    await _fail(breaker)
+    assert breaker.state == "closed"
+    
+    await _fail(breaker)
+    assert breaker.state == "open"
+
+
+@pytest.mark.asyncio
+async def test_circuit_breaker_fails_fast_while_open(clock):
+    """Test calls are rejected without running while the circuit is open."""
+    from app.core.circuit_breaker import CircuitBreaker, CircuitOpenError
+    
+    breaker = CircuitBreaker("svc", failure_threshold=1, recovery_timeout=10.0)
+    await _fail(breaker)
+    
+    clock[0] += 4.0
+    calls = []
+    with pytest.raises(CircuitOpenError) as exc_info:
+        async with breaker:
+            calls.append(1)
+    
+    assert calls == []
+    assert exc_info.value.name == "svc"
+    assert exc_info.value.retry_after == pytest.approx(6.0)
+    assert breaker.state == "open"
+
+
+@pytest.mark.asyncio
+async def test_circuit_breaker_recovers_via_half_open(clock):
+    """Test a successful trial call after recovery_timeout closes the circuit."""
+    from app.core.circuit_breaker import CircuitBreaker, CircuitOpenError
+    
+    breaker = CircuitBreaker("svc", failure_threshold=1, recovery_timeout=10.0)
+    await _fail(breaker)
+    
+    clock[0] += 10.0
+    assert breaker.state == "half_open"
+    
+    # Only one trial call is let through at a time
+    async with breaker:
+        with pytest.raises(CircuitOpenError):
+            async with breaker:
+                pass
+    
+    assert breaker.state == "closed"
+    await _succeed(breaker)
+
+
+@pytest.mark.asyncio
+async def test_circuit_breaker_half_open_failure_reopens(clock):
+    """Test a failed trial call re-opens the circuit for another recovery_timeout."""
+    from app.core.circuit_breaker import CircuitBreaker, CircuitOpenError
+    
+    breaker = CircuitBreaker("svc", failure_threshold=3, recovery_timeout=10.0)
+    for _ in range(3):
+        await _fail(breaker)
+    
+    clock[0] += 10.0
+    await _fail(breaker)
+    assert breaker.state == "open"
+    
+    clock[0] += 5.0
+    with pytest.raises(CircuitOpenError):
+        await _succeed(breaker)
+
+
+@pytest.mark.asyncio
+async def test_circuit_breaker_non_failure_resets_count(clock):
+    """Test exceptions rejected by is_failure reset the consecutive failure count."""
+    from app.core.circuit_breaker import CircuitBreaker
+    
+    breaker = CircuitBreaker(
+        "svc",
+        failure_threshold=2,
+        is_failure=lambda e: not isinstance(e, KeyError)
+    )
+    
+    await _fail(breaker)
+    await _fail(breaker, KeyError("not found"))
+    await _fail(breaker)
+    assert breaker.state == "closed"
+    
+    await _fail(breaker)
+    assert breaker.state == "open"
+
+
+# ==================== Run Tests ====================
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
@@ -14,6 +14,8 @@ import logging
 from typing import Optional, Dict, Any
 from datetime import datetime
 
+from fastapi import HTTPException
+
 logger = logging.getLogger(__name__)
 
 # Configuration
@@ -66,7 +68,6 @@ async def verify_blockchain_integrity(
             BLOCKCHAIN_AUDIT_SERVICE_URL,
             BLOCKCHAIN_VERIFY_PATH
         )
-        from fastapi import HTTPException
         
         result = await verify_audit(
             booking_ref=booking_ref,
@@ -99,9 +100,8 @@ async def verify_blockchain_integrity(
         return normalized
     
     except HTTPException as e:
-        # Check if endpoint is missing/not implemented
-        from app.tools.blockchain_service_client import is_endpoint_missing
-        
+        # Check if endpoint is missing/not implemented (is_endpoint_missing was
+        # imported above: HTTPException can only come from verify_audit)
         if is_endpoint_missing(e):
             logger.warning(f"[{trace_id[:8]}] Blockchain service endpoint not implemented")
             # Return MVP "not_enabled" response
@@ -14,7 +14,7 @@ All functions forward Authorization headers and handle common HTTP errors.
 
 import os
 import logging
-from typing import Optional, Dict, Any, List
+from typing import Optional, Dict, Any, List, TypedDict
 import httpx
 from fastapi import HTTPException, status
 
@@ -43,6 +43,26 @@ INCLUDE_RAW_PAYLOAD = os.getenv("BOOKING_INCLUDE_RAW", "false").lower() in ("tru
 logger.info(f"Booking Service client configured with URL: {BOOKING_SERVICE_URL}")
 
 
+# ============================================================================
+# Response Shape
+# ============================================================================
+
+class BookingStatus(TypedDict):
+    """
+    Normalized booking returned by get_booking_status / get_bookings_batch.
+    
+    When BOOKING_INCLUDE_RAW is enabled a "raw" key with the backend payload
+    is added as well; callers that must not expose it should project onto
+    these keys instead of passing the dict through.
+    """
+    booking_ref: str
+    status: str
+    terminal: str
+    gate: str
+    slot_time: str
+    last_update: str
+
+
 # ============================================================================
 # Module-level HTTP Client (Singleton with Connection Pooling)
 # ============================================================================
@@ -297,7 +317,7 @@ async def get_booking_status(
     booking_ref: str,
     auth_header: Optional[str] = None,
     request_id: Optional[str] = None
-) -> Dict[str, Any]:
+) -> BookingStatus:
     """
     Get status for a single booking reference.
     
@@ -348,7 +368,7 @@ async def get_bookings_batch(
     booking_refs: List[str],
     auth_header: Optional[str] = None,
     request_id: Optional[str] = None
-) -> List[Dict[str, Any]]:
+) -> List[BookingStatus]:
     """
     Get status for multiple booking references in one request.
     
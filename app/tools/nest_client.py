@@ -17,6 +17,7 @@ Uses a module-level singleton AsyncClient for efficient connection pooling.
 
 import os
 import logging
+import importlib.util
 from typing import Optional, Dict, Any
 import httpx
 from fastapi import HTTPException, status
@@ -50,6 +51,12 @@ REQUEST_TIMEOUT = float(os.getenv("NEST_CLIENT_TIMEOUT", "30.0"))
 MAX_CONNECTIONS = int(os.getenv("NEST_CLIENT_MAX_CONNECTIONS", "100"))
 MAX_KEEPALIVE_CONNECTIONS = int(os.getenv("NEST_CLIENT_MAX_KEEPALIVE", "20"))
 
+# HTTP/2 multiplexing (requires the optional "h2" package: pip install httpx[http2])
+HTTP2_ENABLED = (
+    os.getenv("NEST_CLIENT_HTTP2", "true").lower() in ("true", "1", "yes")
+    and importlib.util.find_spec("h2") is not None
+)
+
 logger.info(f"NestJS client configured with backend URL: {NEST_BACKEND_URL}")
 
 
@@ -80,9 +87,10 @@ def get_client() -> httpx.AsyncClient:
         _client = httpx.AsyncClient(
             timeout=REQUEST_TIMEOUT,
             limits=limits,
+            http2=HTTP2_ENABLED,
             follow_redirects=False  # Explicit redirect handling
         )
-        logger.info("Initialized httpx.AsyncClient with connection pooling")
+        logger.info(f"Initialized httpx.AsyncClient with connection pooling (http2={HTTP2_ENABLED})")
     
     return _client
 